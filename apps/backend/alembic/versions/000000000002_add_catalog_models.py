@@ -8,6 +8,8 @@ Create Date: 2025-11-12
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_if_missing, create_table_if_missing
+
 
 # revision identifiers, used by Alembic.
 revision = '000000000002'
@@ -18,7 +20,7 @@ depends_on = None
 
 def upgrade() -> None:
     # Create countries table
-    op.create_table(
+    create_table_if_missing(
         'countries',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('iso2', sa.String(length=2), nullable=False),
@@ -26,23 +28,20 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('iso2'),
     )
-    op.create_index('idx_country_iso2_name', 'countries', ['iso2', 'name'])
-    op.create_index('ix_countries_id', 'countries', ['id'])
-    op.create_index('ix_countries_iso2', 'countries', ['iso2'])
-    op.create_index('ix_countries_name', 'countries', ['name'])
+    create_index_if_missing('idx_country_iso2_name', 'countries', ['iso2', 'name'])
+    create_index_if_missing('ix_countries_name', 'countries', ['name'])
 
     # Create carriers table
-    op.create_table(
+    create_table_if_missing(
         'carriers',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index('ix_carriers_id', 'carriers', ['id'])
-    op.create_index('ix_carriers_name', 'carriers', ['name'])
+    create_index_if_missing('ix_carriers_name', 'carriers', ['name'])
 
     # Create plans table
-    op.create_table(
+    create_table_if_missing(
         'plans',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('country_id', sa.Integer(), nullable=False),
@@ -57,25 +56,18 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['country_id'], ['countries.id'], ),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index('idx_plan_country_carrier', 'plans', ['country_id', 'carrier_id'])
-    op.create_index('idx_plan_price', 'plans', ['price_usd'])
-    op.create_index('ix_plans_carrier_id', 'plans', ['carrier_id'])
-    op.create_index('ix_plans_country_id', 'plans', ['country_id'])
-    op.create_index('ix_plans_id', 'plans', ['id'])
+    create_index_if_missing('idx_plan_country_carrier', 'plans', ['country_id', 'carrier_id'])
+    create_index_if_missing('idx_plan_price', 'plans', ['price_usd'])
+    create_index_if_missing('ix_plans_carrier_id', 'plans', ['carrier_id'])
 
 
 def downgrade() -> None:
-    op.drop_index('ix_plans_id', table_name='plans')
-    op.drop_index('ix_plans_country_id', table_name='plans')
     op.drop_index('ix_plans_carrier_id', table_name='plans')
     op.drop_index('idx_plan_price', table_name='plans')
     op.drop_index('idx_plan_country_carrier', table_name='plans')
     op.drop_table('plans')
     op.drop_index('ix_carriers_name', table_name='carriers')
-    op.drop_index('ix_carriers_id', table_name='carriers')
     op.drop_table('carriers')
     op.drop_index('ix_countries_name', table_name='countries')
-    op.drop_index('ix_countries_iso2', table_name='countries')
-    op.drop_index('ix_countries_id', table_name='countries')
     op.drop_index('idx_country_iso2_name', table_name='countries')
     op.drop_table('countries')
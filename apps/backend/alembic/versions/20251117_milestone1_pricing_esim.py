@@ -9,6 +9,8 @@ Create Date: 2025-11-17 00:00:00.000000
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import add_column_if_missing, update_in_batches
+
 
 # revision identifiers, used by Alembic.
 revision = "20251117_milestone1"
@@ -18,10 +20,16 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("orders", sa.Column("plan_snapshot", sa.JSON(), nullable=True))
+    add_column_if_missing(
+        "orders", sa.Column("plan_snapshot", sa.JSON(), nullable=True)
+    )
 
-    op.add_column("esim_profiles", sa.Column("qr_payload", sa.Text(), nullable=True))
-    op.add_column("esim_profiles", sa.Column("instructions", sa.Text(), nullable=True))
+    add_column_if_missing(
+        "esim_profiles", sa.Column("qr_payload", sa.Text(), nullable=True)
+    )
+    add_column_if_missing(
+        "esim_profiles", sa.Column("instructions", sa.Text(), nullable=True)
+    )
     op.alter_column(
         "esim_profiles",
         "activation_code",
@@ -32,16 +40,15 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     # Ensure there are no NULL activation codes before making column non-nullable again
-    connection = op.get_bind()
     esim_table = sa.table(
         "esim_profiles",
         sa.column("id", sa.Integer),
         sa.column("activation_code", sa.String(length=128)),
     )
-    connection.execute(
-        esim_table.update()
-        .where(esim_table.c.activation_code.is_(None))
-        .values(activation_code="")
+    update_in_batches(
+        esim_table,
+        {"activation_code": ""},
+        esim_table.c.activation_code.is_(None),
     )
 
     op.alter_column(
@@ -11,6 +11,12 @@ from sqlalchemy.dialects import mysql
 
 from alembic import op
 
+from app.db.migration_helpers import (
+    column_exists,
+    create_index_if_missing,
+    create_table_if_missing,
+)
+
 # revision identifiers, used by Alembic.
 revision = "20251120_add_esim_inventory"
 down_revision = "20251120_connected_you"
@@ -38,7 +44,7 @@ ESIM_INVENTORY_STATUS = mysql.ENUM(
 
 
 def upgrade() -> None:
-    op.create_table(
+    create_table_if_missing(
         "esim_inventory",
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("plan_id", sa.Integer(), sa.ForeignKey("plans.id"), nullable=True),
@@ -74,27 +80,55 @@ def upgrade() -> None:
         ),
         mysql_engine="InnoDB",
     )
-    op.create_index("ix_esim_inventory_plan_id", "esim_inventory", ["plan_id"])
-    op.create_index("ix_esim_inventory_country_id", "esim_inventory", ["country_id"])
-    op.create_index("ix_esim_inventory_carrier_id", "esim_inventory", ["carrier_id"])
+    create_index_if_missing("ix_esim_inventory_plan_id", "esim_inventory", ["plan_id"])
+    create_index_if_missing(
+        "ix_esim_inventory_country_id", "esim_inventory", ["country_id"]
+    )
+    create_index_if_missing(
+        "ix_esim_inventory_carrier_id", "esim_inventory", ["carrier_id"]
+    )
 
-    with op.batch_alter_table("esim_profiles") as batch_op:
-        batch_op.alter_column(
-            "status",
-            existing_type=OLD_ESIM_STATUS,
-            type_=NEW_ESIM_STATUS,
-            existing_nullable=False,
-        )
-        batch_op.add_column(sa.Column("inventory_item_id", sa.Integer(), nullable=True))
-        batch_op.create_index(
-            "ix_esim_profiles_inventory_item_id", ["inventory_item_id"]
-        )
-        batch_op.create_foreign_key(
-            "fk_esim_profiles_inventory_item_id",
-            "esim_inventory",
-            ["inventory_item_id"],
-            ["id"],
+    if column_exists("esim_profiles", "inventory_item_id"):
+        # The ALTER below is atomic, so the column means it already ran.
+        return
+
+    if op.get_context().dialect.name == "mysql":
+        # A single ALTER rebuilds esim_profiles once instead of once per clause.
+        # The new statuses are inserted mid-list (not appended) and the FK is
+        # validated, so MySQL cannot use ALGORITHM=INSTANT/INPLACE here.
+        status_values = ", ".join(f"'{value}'" for value in NEW_ESIM_STATUS.enums)
+        op.execute(
+            sa.text(
+                f"""
+            ALTER TABLE esim_profiles
+            MODIFY COLUMN status ENUM({status_values}) NOT NULL,
+            ADD COLUMN inventory_item_id INTEGER NULL,
+            ADD INDEX ix_esim_profiles_inventory_item_id (inventory_item_id),
+            ADD CONSTRAINT fk_esim_profiles_inventory_item_id
+                FOREIGN KEY (inventory_item_id) REFERENCES esim_inventory (id)
+            """
+            )
         )
+    else:
+        with op.batch_alter_table("esim_profiles") as batch_op:
+            batch_op.alter_column(
+                "status",
+                existing_type=OLD_ESIM_STATUS,
+                type_=NEW_ESIM_STATUS,
+                existing_nullable=False,
+            )
+            batch_op.add_column(
+                sa.Column("inventory_item_id", sa.Integer(), nullable=True)
+            )
+            batch_op.create_index(
+                "ix_esim_profiles_inventory_item_id", ["inventory_item_id"]
+            )
+            batch_op.create_foreign_key(
+                "fk_esim_profiles_inventory_item_id",
+                "esim_inventory",
+                ["inventory_item_id"],
+                ["id"],
+            )
 
 
 def downgrade() -> None:
@@ -10,6 +10,8 @@ import sqlalchemy as sa
 
 from alembic import op
 
+from app.db.migration_helpers import add_column_if_missing
+
 # revision identifiers, used by Alembic.
 revision = "20251120_connected_you"
 down_revision = "20251117_milestone1"
@@ -18,15 +20,15 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
+    add_column_if_missing(
         "esim_profiles",
         sa.Column("provider_reference", sa.String(length=128), nullable=True),
     )
-    op.add_column(
+    add_column_if_missing(
         "esim_profiles",
         sa.Column("provisioned_at", sa.DateTime(), nullable=True),
     )
-    op.add_column(
+    add_column_if_missing(
         "esim_profiles",
         sa.Column("provider_payload", sa.JSON(), nullable=True),
     )
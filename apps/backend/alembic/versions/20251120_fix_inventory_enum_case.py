@@ -21,10 +21,25 @@ LOWERCASE_ENUM = "available','reserved','assigned','retired"
 UPPERCASE_ENUM = "AVAILABLE','RESERVED','ASSIGNED','RETIRED"
 
 
+def _normalize_status_case(conn, case_function: str) -> None:
+    """Rewrite rows whose stored status differs from the target case.
+
+    On upgrade this skips rows that are already lowercase. On downgrade every
+    value under the lowercase ENUM differs from its uppercase form, so that
+    pass touches all rows, exactly like the unconditional UPDATE it replaced.
+    """
+    conn.execute(
+        sa.text(
+            f"UPDATE esim_inventory SET status = {case_function}(status) "
+            f"WHERE BINARY status <> {case_function}(status)"
+        )
+    )
+
+
 def upgrade() -> None:
     conn = op.get_bind()
     # Normalize existing values to lowercase before altering column type
-    conn.execute(sa.text("UPDATE esim_inventory SET status = LOWER(status)"))
+    _normalize_status_case(conn, "LOWER")
     conn.execute(
         sa.text(
             """
@@ -38,7 +53,7 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     conn = op.get_bind()
-    conn.execute(sa.text("UPDATE esim_inventory SET status = UPPER(status)"))
+    _normalize_status_case(conn, "UPPER")
     conn.execute(
         sa.text(
             """
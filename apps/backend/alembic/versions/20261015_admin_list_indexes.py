@@ -0,0 +1,45 @@
+"""add composite indexes for admin order/inventory/payment listings
+
+Revision ID: 20261015_admin_list_indexes
+Revises: 20261015_carrier_name_lower_uq
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_online
+
+# revision identifiers, used by Alembic.
+revision = "20261015_admin_list_indexes"
+down_revision = "20261015_carrier_name_lower_uq"
+branch_labels = None
+depends_on = None
+
+
+# (filter columns..., sort column) prefixes used by the /admin list endpoints.
+INDEXES = [
+    ("ix_orders_status_created", "orders", ["status", "created_at"]),
+    ("ix_orders_plan_created", "orders", ["plan_id", "created_at"]),
+    ("ix_orders_user_created", "orders", ["user_id", "created_at"]),
+    (
+        "ix_esim_inventory_status_plan_created",
+        "esim_inventory",
+        ["status", "plan_id", "created_at"],
+    ),
+    (
+        "ix_payments_provider_status_created",
+        "payments",
+        ["provider", "status", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        create_index_online(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
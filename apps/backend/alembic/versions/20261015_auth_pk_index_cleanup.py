@@ -0,0 +1,38 @@
+"""drop redundant primary key indexes on auth/order tables
+
+Revision ID: 20261015_auth_pk_index_cleanup
+Revises: 20261015_catalog_index_cleanup
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import drop_index_if_exists
+
+# revision identifiers, used by Alembic.
+revision = "20261015_auth_pk_index_cleanup"
+down_revision = "20261015_catalog_index_cleanup"
+branch_labels = None
+depends_on = None
+
+
+# 000000000003 declared index=True on each primary key, which duplicated the
+# PRIMARY KEY index on every table it created.
+REDUNDANT_INDEXES = [
+    ("ix_users_id", "users"),
+    ("ix_auth_codes_id", "auth_codes"),
+    ("ix_orders_id", "orders"),
+    ("ix_esim_profiles_id", "esim_profiles"),
+    ("ix_payments_id", "payments"),
+]
+
+
+def upgrade() -> None:
+    for name, table in REDUNDANT_INDEXES:
+        drop_index_if_exists(name, table)
+
+
+def downgrade() -> None:
+    for name, table in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, ["id"])
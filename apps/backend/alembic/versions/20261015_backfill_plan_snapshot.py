@@ -0,0 +1,124 @@
+"""backfill orders.plan_snapshot for orders created before it was stored
+
+Revision ID: 20261015_backfill_plan_snapshot
+Revises: 20261015_admin_list_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from decimal import Decimal
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.services.pricing import to_minor_units
+
+# revision identifiers, used by Alembic.
+revision = "20261015_backfill_plan_snapshot"
+down_revision = "20261015_admin_list_indexes"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1_000
+
+orders = sa.table(
+    "orders",
+    sa.column("id", sa.Integer),
+    sa.column("plan_id", sa.Integer),
+    sa.column("currency", sa.String),
+    sa.column("plan_snapshot", sa.JSON),
+)
+plans = sa.table(
+    "plans",
+    sa.column("id", sa.Integer),
+    sa.column("name", sa.String),
+    sa.column("description", sa.Text),
+    sa.column("country_id", sa.Integer),
+    sa.column("carrier_id", sa.Integer),
+    sa.column("data_gb", sa.Numeric),
+    sa.column("duration_days", sa.Integer),
+    sa.column("price_usd", sa.Numeric),
+)
+countries = sa.table(
+    "countries",
+    sa.column("id", sa.Integer),
+    sa.column("name", sa.String),
+    sa.column("iso2", sa.String),
+)
+carriers = sa.table(
+    "carriers", sa.column("id", sa.Integer), sa.column("name", sa.String)
+)
+
+
+def _snapshot(row: sa.Row) -> dict:
+    # Same shape as app.api.orders._build_plan_snapshot writes at checkout.
+    return {
+        "id": row.plan_id,
+        "name": row.name,
+        "description": row.description,
+        "country_name": row.country_name,
+        "country_iso2": row.country_iso2,
+        "country_id": row.country_id,
+        "carrier_id": row.carrier_id,
+        "carrier_name": row.carrier_name,
+        "data_gb": float(row.data_gb) if row.data_gb is not None else None,
+        "duration_days": row.duration_days,
+        "price_minor_units": to_minor_units(row.price_usd or Decimal("0")),
+        "currency": row.currency or "USD",
+    }
+
+
+def upgrade() -> None:
+    # The snapshot is built in Python, which has no rows to work on when
+    # emitting SQL (--sql); run this revision online to backfill.
+    if op.get_context().as_sql:
+        return
+
+    bind = op.get_bind()
+    query = (
+        sa.select(
+            orders.c.id,
+            orders.c.plan_id,
+            orders.c.currency,
+            plans.c.name,
+            plans.c.description,
+            plans.c.country_id,
+            plans.c.carrier_id,
+            plans.c.data_gb,
+            plans.c.duration_days,
+            plans.c.price_usd,
+            countries.c.name.label("country_name"),
+            countries.c.iso2.label("country_iso2"),
+            carriers.c.name.label("carrier_name"),
+        )
+        .select_from(orders)
+        .join(plans, plans.c.id == orders.c.plan_id)
+        .outerjoin(countries, countries.c.id == plans.c.country_id)
+        .outerjoin(carriers, carriers.c.id == plans.c.carrier_id)
+        .where(orders.c.plan_snapshot.is_(None))
+        .order_by(orders.c.id)
+        .limit(BATCH_SIZE)
+    )
+    update = (
+        orders.update()
+        .where(orders.c.id == sa.bindparam("order_id"))
+        .values(plan_snapshot=sa.bindparam("snapshot"))
+    )
+
+    # Each batch is committed on its own; filled rows drop out of the WHERE.
+    last_id = 0
+    with op.get_context().autocommit_block():
+        while True:
+            rows = bind.execute(query.where(orders.c.id > last_id)).all()
+            if not rows:
+                break
+            bind.execute(
+                update,
+                [{"order_id": row.id, "snapshot": _snapshot(row)} for row in rows],
+            )
+            last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    # Backfilled snapshots are indistinguishable from ones written at checkout.
+    pass
@@ -0,0 +1,51 @@
+"""make carrier names unique regardless of case
+
+Revision ID: 20261015_carrier_name_lower_uq
+Revises: 20261015_rename_inventory_meta
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_if_missing
+
+# revision identifiers, used by Alembic.
+revision = "20261015_carrier_name_lower_uq"
+down_revision = "20261015_rename_inventory_meta"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not op.get_context().as_sql:
+        duplicates = (
+            op.get_bind()
+            .execute(
+                sa.text(
+                    "SELECT lower(name) FROM carriers "
+                    "GROUP BY lower(name) HAVING count(*) > 1"
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if duplicates:
+            raise RuntimeError(
+                "Merge carriers whose names differ only by case before upgrading: "
+                + ", ".join(duplicates)
+            )
+
+    # Functional index (MySQL 8.0.13+); backs the duplicate check in the admin API.
+    create_index_if_missing(
+        "uq_carriers_name_lower",
+        "carriers",
+        [sa.func.lower(sa.column("name"))],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_carriers_name_lower", table_name="carriers")
@@ -0,0 +1,38 @@
+"""drop redundant catalog indexes
+
+Revision ID: 20261015_catalog_index_cleanup
+Revises: 20251120_fix_inventory_enum_case
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import drop_index_if_exists
+
+# revision identifiers, used by Alembic.
+revision = "20261015_catalog_index_cleanup"
+down_revision = "20251120_fix_inventory_enum_case"
+branch_labels = None
+depends_on = None
+
+
+# Primary keys are already indexed, the iso2 UNIQUE constraint already has its
+# own index, and idx_plan_country_carrier leads with country_id.
+REDUNDANT_INDEXES = [
+    ("ix_countries_id", "countries", ["id"]),
+    ("ix_countries_iso2", "countries", ["iso2"]),
+    ("ix_carriers_id", "carriers", ["id"]),
+    ("ix_plans_id", "plans", ["id"]),
+    ("ix_plans_country_id", "plans", ["country_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, _columns in REDUNDANT_INDEXES:
+        drop_index_if_exists(name, table)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, columns)
@@ -0,0 +1,36 @@
+"""add (created_at, id) indexes for keyset pagination of admin lists
+
+Revision ID: 20261015_created_id_indexes
+Revises: 20261015_backfill_plan_snapshot
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_online
+
+# revision identifiers, used by Alembic.
+revision = "20261015_created_id_indexes"
+down_revision = "20261015_backfill_plan_snapshot"
+branch_labels = None
+depends_on = None
+
+
+# The unfiltered /admin lists page newest first on (created_at, id).
+INDEXES = [
+    ("ix_orders_created_id", "orders"),
+    ("ix_payments_created_id", "payments"),
+    ("ix_esim_profiles_created_id", "esim_profiles"),
+    ("ix_esim_inventory_created_id", "esim_inventory"),
+]
+
+
+def upgrade() -> None:
+    for name, table in INDEXES:
+        create_index_online(name, table, ["created_at", "id"])
+
+
+def downgrade() -> None:
+    for name, table in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,25 @@
+"""add plans (country_id, price_usd) index
+
+Revision ID: 20261015_plan_country_price_idx
+Revises: 20261015_auth_pk_index_cleanup
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_online
+
+# revision identifiers, used by Alembic.
+revision = "20261015_plan_country_price_idx"
+down_revision = "20261015_auth_pk_index_cleanup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_online("idx_plan_country_price", "plans", ["country_id", "price_usd"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_plan_country_price", table_name="plans")
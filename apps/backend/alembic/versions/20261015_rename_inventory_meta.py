@@ -0,0 +1,38 @@
+"""rename esim_inventory.metadata to extra_metadata
+
+Revision ID: 20261015_rename_inventory_meta
+Revises: 20261015_plan_country_price_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261015_rename_inventory_meta"
+down_revision = "20261015_plan_country_price_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Metadata-only rename on MySQL 8; lets EsimInventory map the column 1:1.
+    op.alter_column(
+        "esim_inventory",
+        "metadata",
+        new_column_name="extra_metadata",
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "esim_inventory",
+        "extra_metadata",
+        new_column_name="metadata",
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+    )
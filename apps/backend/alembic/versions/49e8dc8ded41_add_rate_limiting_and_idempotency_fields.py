@@ -8,6 +8,8 @@ Create Date: 2025-11-12 21:52:54.834352
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import add_column_if_missing, create_index_online
+
 
 # revision identifiers, used by Alembic.
 revision = '49e8dc8ded41'
@@ -18,14 +20,14 @@ depends_on = None
 
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('auth_codes', sa.Column('ip_address', sa.String(length=45), nullable=True))
-    op.add_column('auth_codes', sa.Column('created_at', sa.DateTime(), nullable=True))
-    op.add_column('auth_codes', sa.Column('attempts', sa.Integer(), nullable=True))
-    op.create_index(op.f('ix_auth_codes_created_at'), 'auth_codes', ['created_at'], unique=False)
-    op.add_column('orders', sa.Column('idempotency_key', sa.String(length=255), nullable=True))
-    op.create_index(op.f('ix_orders_idempotency_key'), 'orders', ['idempotency_key'], unique=True)
-    op.add_column('payments', sa.Column('intent_id', sa.String(length=255), nullable=True))
-    op.create_index(op.f('ix_payments_intent_id'), 'payments', ['intent_id'], unique=True)
+    add_column_if_missing('auth_codes', sa.Column('ip_address', sa.String(length=45), nullable=True))
+    add_column_if_missing('auth_codes', sa.Column('created_at', sa.DateTime(), nullable=True))
+    add_column_if_missing('auth_codes', sa.Column('attempts', sa.Integer(), nullable=True))
+    create_index_online('ix_auth_codes_created_at', 'auth_codes', ['created_at'])
+    add_column_if_missing('orders', sa.Column('idempotency_key', sa.String(length=255), nullable=True))
+    create_index_online('ix_orders_idempotency_key', 'orders', ['idempotency_key'], unique=True)
+    add_column_if_missing('payments', sa.Column('intent_id', sa.String(length=255), nullable=True))
+    create_index_online('ix_payments_intent_id', 'payments', ['intent_id'], unique=True)
     # ### end Alembic commands ###
 
 
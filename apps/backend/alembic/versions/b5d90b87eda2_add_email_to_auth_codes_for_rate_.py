@@ -9,6 +9,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import mysql
 
+from app.db.migration_helpers import add_column_if_missing, create_index_online
+
 # revision identifiers, used by Alembic.
 revision = 'b5d90b87eda2'
 down_revision = '49e8dc8ded41'
@@ -18,11 +20,11 @@ depends_on = None
 
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('auth_codes', sa.Column('email', sa.String(length=255), nullable=False))
+    add_column_if_missing('auth_codes', sa.Column('email', sa.String(length=255), nullable=False))
     op.alter_column('auth_codes', 'user_id',
                existing_type=mysql.INTEGER(),
                nullable=True)
-    op.create_index(op.f('ix_auth_codes_email'), 'auth_codes', ['email'], unique=False)
+    create_index_online('ix_auth_codes_email', 'auth_codes', ['email'])
     # ### end Alembic commands ###
 
 
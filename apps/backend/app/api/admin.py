@@ -1,16 +1,30 @@
+import base64
 import csv
 import io
-from collections import Counter, defaultdict
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from enum import Enum
+from functools import lru_cache
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+import orjson
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, or_
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager, joinedload, raiseload, selectinload
 
+from ..core.responses import ORJSONResponse, etag_json_response
 from ..db.session import get_db
 from ..models import (
     Carrier,
@@ -26,6 +40,7 @@ from ..models.auth_models import (
     EsimInventoryStatus,
     EsimStatus,
     OrderStatus,
+    PaymentProvider,
     PaymentStatus,
 )
 from ..schemas.admin import (
@@ -45,9 +60,64 @@ from ..schemas.admin import (
     PlanUpdate,
 )
 from ..schemas.catalog import CarrierRead, CountryRead, PlanRead
+from ..services.cache import admin_cache
 from .auth import get_current_admin
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(
+    prefix="/admin", tags=["admin"], default_response_class=ORJSONResponse
+)
+
+# Validate/dump whole result pages in one pydantic-core call.
+COUNTRY_LIST_ADAPTER = TypeAdapter(list[CountryRead])
+CARRIER_LIST_ADAPTER = TypeAdapter(list[CarrierRead])
+PLAN_LIST_ADAPTER = TypeAdapter(list[PlanRead])
+ORDER_LIST_ADAPTER = TypeAdapter(list[AdminOrderRead])
+PAYMENT_LIST_ADAPTER = TypeAdapter(list[AdminPaymentRead])
+ESIM_LIST_ADAPTER = TypeAdapter(list[AdminEsimProfileRead])
+INVENTORY_LIST_ADAPTER = TypeAdapter(list[AdminInventoryRead])
+
+# CSV imports resolve referenced rows with IN lists of at most this many keys
+# (SQLite caps bound parameters per statement).
+IMPORT_LOOKUP_BATCH_SIZE = 500
+
+# The plans CSV export reads this many rows per fetch and sends ~64KB chunks.
+CSV_EXPORT_BATCH_SIZE = 1_000
+CSV_EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Plan export columns, in file order; the header row is their keys.
+PLAN_CSV_COLUMNS = (
+    Plan.id,
+    Plan.name,
+    Plan.country_id,
+    Plan.carrier_id,
+    Plan.data_gb,
+    Plan.is_unlimited,
+    Plan.duration_days,
+    Plan.price_usd,
+    Plan.description,
+)
+PLAN_CSV_HEADER = tuple(column.key for column in PLAN_CSV_COLUMNS)
+
+# Sortable columns per list endpoint; unknown sort_by values fall back to name
+# (created_at for orders and inventory).
+COUNTRY_SORT_COLUMNS = {"name": Country.name, "iso2": Country.iso2}
+CARRIER_SORT_COLUMNS = {"name": Carrier.name, "id": Carrier.id}
+PLAN_SORT_COLUMNS = {
+    "name": Plan.name,
+    "price_usd": Plan.price_usd,
+    "duration_days": Plan.duration_days,
+    "data_gb": Plan.data_gb,
+}
+ORDER_SORT_COLUMNS = {
+    "created_at": Order.created_at,
+    "amount": Order.amount_minor_units,
+    "status": Order.status,
+}
+INVENTORY_SORT_COLUMNS = {
+    "created_at": EsimInventory.created_at,
+    "status": EsimInventory.status,
+    "plan_id": EsimInventory.plan_id,
+}
 
 
 # ========================================
@@ -55,54 +125,63 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 # ========================================
 
 
-@router.get("/countries", response_model=PaginatedResponse)
+@router.get("/countries", responses={200: {"model": PaginatedResponse}})
 def list_countries(
+    request: Request,
     q: str = Query("", description="Search by name or ISO2"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("name", description="Sort field: name, iso2"),
     sort_order: str = Query("asc", description="Sort order: asc, desc"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
     """List all countries with search, sorting, and pagination (admin only)."""
+    q = q.strip()
+    cache_key = ("countries", q, page, page_size, sort_by, sort_order.lower(), after)
+    cached = admin_cache.get(cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     query = db.query(Country)
 
-    # Search
+    # Search. ISO2 codes are exactly two letters, so "%q%" on iso2 is an
+    # exact match for two-letter terms and can never match longer ones.
     if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(
-                Country.name.ilike(search_term),
-                Country.iso2.ilike(search_term),
-            )
-        )
-
-    # Count total
-    total = query.count()
-
-    # Sorting
-    sort_column = getattr(Country, sort_by, Country.name)
-    if sort_order.lower() == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column)
-
-    # Paginate
-    offset = (page - 1) * page_size
-    items = query.offset(offset).limit(page_size).all()
+        name_match = Country.name.ilike(f"%{q}%")
+        if len(q) == 2:
+            query = query.filter(or_(name_match, Country.iso2 == q.upper()))
+        elif len(q) == 1:
+            query = query.filter(or_(name_match, Country.iso2.ilike(f"%{q}%")))
+        else:
+            query = query.filter(name_match)
+
+    # Sort and paginate
+    items, total, next_cursor = _sorted_page(
+        query,
+        COUNTRY_SORT_COLUMNS.get(sort_by, Country.name),
+        Country.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+    )
 
-    return {
-        "items": [CountryRead.model_validate(item) for item in items],
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    body = ORJSONResponse(
+        _page_payload(
+            _dump_page(COUNTRY_LIST_ADAPTER, items), total, page, page_size, next_cursor
+        )
+    ).body
+    admin_cache.set(cache_key, body)
+    return etag_json_response(request, body)
 
 
 @router.post(
-    "/countries", response_model=CountryRead, status_code=status.HTTP_201_CREATED
+    "/countries",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": CountryRead}},
 )
 def create_country(
     payload: CountryCreate,
@@ -110,31 +189,21 @@ def create_country(
     _: User = Depends(get_current_admin),
 ):
     """Create a new country (admin only)."""
-    # Validate ISO2 uppercase
-    iso2 = payload.iso2.upper()
-    if len(iso2) != 2 or not iso2.isalpha():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ISO2 must be exactly 2 uppercase letters",
-        )
-
-    # Check for duplicate
-    existing = db.query(Country).filter(Country.iso2 == iso2).first()
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Country with ISO2 '{iso2}' already exists",
-        )
+    iso2 = payload.iso2  # Normalized to uppercase by CountryCreate
 
     country = Country(iso2=iso2, name=payload.name)
     db.add(country)
+    # Assigns the id; the iso2 unique constraint rejects duplicates
+    _flush_unique(db, f"Country with ISO2 '{iso2}' already exists")
+    # Serialize before commit expires the instance, so no reload is needed
+    body = CountryRead.model_validate(country).model_dump()
     db.commit()
-    db.refresh(country)
+    admin_cache.invalidate("countries")
 
-    return CountryRead.model_validate(country)
+    return ORJSONResponse(body, status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/countries/{country_id}", response_model=CountryRead)
+@router.put("/countries/{country_id}", responses={200: {"model": CountryRead}})
 def update_country(
     country_id: int,
     payload: CountryUpdate,
@@ -142,41 +211,25 @@ def update_country(
     _: User = Depends(get_current_admin),
 ):
     """Update an existing country (admin only)."""
-    country = db.query(Country).filter(Country.id == country_id).first()
+    country = db.get(Country, country_id)
     if not country:
         raise HTTPException(status_code=404, detail="Country not found")
 
     # Update ISO2 if provided
     if payload.iso2 is not None:
-        iso2 = payload.iso2.upper()
-        if len(iso2) != 2 or not iso2.isalpha():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="ISO2 must be exactly 2 uppercase letters",
-            )
-
-        # Check for duplicate (excluding current country)
-        existing = (
-            db.query(Country)
-            .filter(Country.iso2 == iso2, Country.id != country_id)
-            .first()
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Country with ISO2 '{iso2}' already exists",
-            )
-
-        country.iso2 = iso2  # type: ignore
+        country.iso2 = payload.iso2  # type: ignore
 
     # Update name if provided
     if payload.name is not None:
         country.name = payload.name  # type: ignore
 
+    _flush_unique(db, f"Country with ISO2 '{country.iso2}' already exists")
+    body = CountryRead.model_validate(country).model_dump()
     db.commit()
-    db.refresh(country)
+    admin_cache.invalidate("countries")
+    admin_cache.invalidate("plans")  # Plan rows embed the country
 
-    return CountryRead.model_validate(country)
+    return ORJSONResponse(body)
 
 
 @router.delete("/countries/{country_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -186,20 +239,13 @@ def delete_country(
     _: User = Depends(get_current_admin),
 ):
     """Delete a country (admin only). Fails if referenced by plans."""
-    country = db.query(Country).filter(Country.id == country_id).first()
+    country = db.get(Country, country_id)
     if not country:
         raise HTTPException(status_code=404, detail="Country not found")
 
-    # Check for dependent plans
-    plans_count = db.query(Plan).filter(Plan.country_id == country_id).count()
-    if plans_count > 0:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Cannot delete country: {plans_count} plan(s) reference it",
-        )
-
-    db.delete(country)
-    db.commit()
+    # The plans FK (ON DELETE RESTRICT) rejects the delete while plans remain
+    _delete_or_conflict(db, country, "country", Plan.country_id == country_id)
+    admin_cache.invalidate("countries")
 
 
 # ========================================
@@ -207,17 +253,26 @@ def delete_country(
 # ========================================
 
 
-@router.get("/carriers", response_model=PaginatedResponse)
+@router.get("/carriers", responses={200: {"model": PaginatedResponse}})
 def list_carriers(
+    request: Request,
     q: str = Query("", description="Search by name"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("name", description="Sort field: name, id"),
     sort_order: str = Query("asc", description="Sort order: asc, desc"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
     """List all carriers with search, sorting, and pagination (admin only)."""
+    q = q.strip()
+    cache_key = ("carriers", q, page, page_size, sort_by, sort_order.lower(), after)
+    cached = admin_cache.get(cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     query = db.query(Carrier)
 
     # Search
@@ -225,31 +280,30 @@ def list_carriers(
         search_term = f"%{q}%"
         query = query.filter(Carrier.name.ilike(search_term))
 
-    # Count total
-    total = query.count()
-
-    # Sorting
-    sort_column = getattr(Carrier, sort_by, Carrier.name)
-    if sort_order.lower() == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column)
-
-    # Paginate
-    offset = (page - 1) * page_size
-    items = query.offset(offset).limit(page_size).all()
+    # Sort and paginate
+    items, total, next_cursor = _sorted_page(
+        query,
+        CARRIER_SORT_COLUMNS.get(sort_by, Carrier.name),
+        Carrier.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+    )
 
-    return {
-        "items": [CarrierRead.model_validate(item) for item in items],
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    body = ORJSONResponse(
+        _page_payload(
+            _dump_page(CARRIER_LIST_ADAPTER, items), total, page, page_size, next_cursor
+        )
+    ).body
+    admin_cache.set(cache_key, body)
+    return etag_json_response(request, body)
 
 
 @router.post(
-    "/carriers", response_model=CarrierRead, status_code=status.HTTP_201_CREATED
+    "/carriers",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": CarrierRead}},
 )
 def create_carrier(
     payload: CarrierCreate,
@@ -264,23 +318,18 @@ def create_carrier(
             detail="Carrier name cannot be empty",
         )
 
-    # Check for duplicate
-    existing = db.query(Carrier).filter(Carrier.name == payload.name).first()
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Carrier '{payload.name}' already exists",
-        )
-
     carrier = Carrier(name=payload.name)
     db.add(carrier)
+    # Assigns the id; uq_carriers_name_lower rejects duplicates in any case
+    _flush_unique(db, f"Carrier '{payload.name}' already exists")
+    body = CarrierRead.model_validate(carrier).model_dump()
     db.commit()
-    db.refresh(carrier)
+    admin_cache.invalidate("carriers")
 
-    return CarrierRead.model_validate(carrier)
+    return ORJSONResponse(body, status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/carriers/{carrier_id}", response_model=CarrierRead)
+@router.put("/carriers/{carrier_id}", responses={200: {"model": CarrierRead}})
 def update_carrier(
     carrier_id: int,
     payload: CarrierUpdate,
@@ -288,7 +337,7 @@ def update_carrier(
     _: User = Depends(get_current_admin),
 ):
     """Update an existing carrier (admin only)."""
-    carrier = db.query(Carrier).filter(Carrier.id == carrier_id).first()
+    carrier = db.get(Carrier, carrier_id)
     if not carrier:
         raise HTTPException(status_code=404, detail="Carrier not found")
 
@@ -300,24 +349,15 @@ def update_carrier(
                 detail="Carrier name cannot be empty",
             )
 
-        # Check for duplicate (excluding current carrier)
-        existing = (
-            db.query(Carrier)
-            .filter(Carrier.name == payload.name, Carrier.id != carrier_id)
-            .first()
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Carrier '{payload.name}' already exists",
-            )
-
         carrier.name = payload.name  # type: ignore
 
+    _flush_unique(db, f"Carrier '{carrier.name}' already exists")
+    body = CarrierRead.model_validate(carrier).model_dump()
     db.commit()
-    db.refresh(carrier)
+    admin_cache.invalidate("carriers")
+    admin_cache.invalidate("plans")  # Plan rows embed the carrier
 
-    return CarrierRead.model_validate(carrier)
+    return ORJSONResponse(body)
 
 
 @router.delete("/carriers/{carrier_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -327,20 +367,13 @@ def delete_carrier(
     _: User = Depends(get_current_admin),
 ):
     """Delete a carrier (admin only). Fails if referenced by plans."""
-    carrier = db.query(Carrier).filter(Carrier.id == carrier_id).first()
+    carrier = db.get(Carrier, carrier_id)
     if not carrier:
         raise HTTPException(status_code=404, detail="Carrier not found")
 
-    # Check for dependent plans
-    plans_count = db.query(Plan).filter(Plan.carrier_id == carrier_id).count()
-    if plans_count > 0:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Cannot delete carrier: {plans_count} plan(s) reference it",
-        )
-
-    db.delete(carrier)
-    db.commit()
+    # The plans FK (ON DELETE RESTRICT) rejects the delete while plans remain
+    _delete_or_conflict(db, carrier, "carrier", Plan.carrier_id == carrier_id)
+    admin_cache.invalidate("carriers")
 
 
 # ========================================
@@ -348,8 +381,9 @@ def delete_carrier(
 # ========================================
 
 
-@router.get("/plans", response_model=PaginatedResponse)
+@router.get("/plans", responses={200: {"model": PaginatedResponse}})
 def list_plans(
+    request: Request,
     q: str = Query("", description="Search by name"),
     country_id: int | None = Query(None, description="Filter by country ID"),
     carrier_id: int | None = Query(None, description="Filter by carrier ID"),
@@ -359,11 +393,30 @@ def list_plans(
         "name", description="Sort field: name, price_usd, duration_days, data_gb"
     ),
     sort_order: str = Query("asc", description="Sort order: asc, desc"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
     """List all plans with search, filters, sorting, and pagination (admin only)."""
-    query = db.query(Plan)
+    q = q.strip()
+    cache_key = (
+        "plans",
+        q,
+        country_id,
+        carrier_id,
+        page,
+        page_size,
+        sort_by,
+        sort_order.lower(),
+        after,
+    )
+    cached = admin_cache.get(cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
+    # PlanRead nests country and carrier; load them in the same query
+    query = db.query(Plan).options(joinedload(Plan.country), joinedload(Plan.carrier))
 
     # Search
     if q:
@@ -377,30 +430,29 @@ def list_plans(
     if carrier_id is not None:
         query = query.filter(Plan.carrier_id == carrier_id)
 
-    # Count total
-    total = query.count()
-
-    # Sorting
-    sort_column = getattr(Plan, sort_by, Plan.name)
-    if sort_order.lower() == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column)
-
-    # Paginate
-    offset = (page - 1) * page_size
-    items = query.offset(offset).limit(page_size).all()
+    # Sort and paginate
+    items, total, next_cursor = _sorted_page(
+        query,
+        PLAN_SORT_COLUMNS.get(sort_by, Plan.name),
+        Plan.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+    )
 
-    return {
-        "items": [PlanRead.model_validate(item) for item in items],
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    body = ORJSONResponse(
+        _page_payload(
+            _dump_page(PLAN_LIST_ADAPTER, items), total, page, page_size, next_cursor
+        )
+    ).body
+    admin_cache.set(cache_key, body)
+    return etag_json_response(request, body)
 
 
-@router.post("/plans", response_model=PlanRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/plans", status_code=status.HTTP_201_CREATED, responses={201: {"model": PlanRead}}
+)
 def create_plan(
     payload: PlanCreate,
     db: Session = Depends(get_db),
@@ -419,40 +471,29 @@ def create_plan(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Duration must be positive"
         )
 
-    # Validate country exists
-    country = db.query(Country).filter(Country.id == payload.country_id).first()
-    if not country:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Country with ID {payload.country_id} not found",
-        )
-
-    # Validate carrier exists
-    carrier = db.query(Carrier).filter(Carrier.id == payload.carrier_id).first()
-    if not carrier:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Carrier with ID {payload.carrier_id} not found",
-        )
+    # Validate country and carrier exist
+    country, carrier = _load_plan_references(db, payload.country_id, payload.carrier_id)
 
     plan = Plan(
-        country_id=payload.country_id,
-        carrier_id=payload.carrier_id,
+        country=country,
+        carrier=carrier,
         name=payload.name,
-        data_gb=payload.data_gb,
+        data_gb=_to_column_scale(payload.data_gb),
         duration_days=payload.duration_days,
-        price_usd=payload.price_usd,
+        price_usd=_to_column_scale(payload.price_usd),
         description=payload.description,
         is_unlimited=payload.is_unlimited,
     )
     db.add(plan)
+    db.flush()  # Assigns the id
+    body = PlanRead.model_validate(plan).model_dump()
     db.commit()
-    db.refresh(plan)
+    admin_cache.invalidate("plans")
 
-    return PlanRead.model_validate(plan)
+    return ORJSONResponse(body, status_code=status.HTTP_201_CREATED)
 
 
-@router.put("/plans/{plan_id}", response_model=PlanRead)
+@router.put("/plans/{plan_id}", responses={200: {"model": PlanRead}})
 def update_plan(
     plan_id: int,
     payload: PlanUpdate,
@@ -460,63 +501,45 @@ def update_plan(
     _: User = Depends(get_current_admin),
 ):
     """Update an existing plan (admin only)."""
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+    plan = db.get(Plan, plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
 
-    # Validate and update country_id
-    if payload.country_id is not None:
-        country = db.query(Country).filter(Country.id == payload.country_id).first()
-        if not country:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Country with ID {payload.country_id} not found",
-            )
-        plan.country_id = payload.country_id  # type: ignore
-
-    # Validate and update carrier_id
-    if payload.carrier_id is not None:
-        carrier = db.query(Carrier).filter(Carrier.id == payload.carrier_id).first()
-        if not carrier:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Carrier with ID {payload.carrier_id} not found",
-            )
-        plan.carrier_id = payload.carrier_id  # type: ignore
-
-    # Update other fields
-    if payload.name is not None:
-        plan.name = payload.name  # type: ignore
-
-    if payload.data_gb is not None:
-        plan.data_gb = payload.data_gb  # type: ignore
-
-    if payload.duration_days is not None:
-        if payload.duration_days <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Duration must be positive",
-            )
-        plan.duration_days = payload.duration_days  # type: ignore
-
-    if payload.price_usd is not None:
-        if payload.price_usd < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Price must be non-negative",
-            )
-        plan.price_usd = payload.price_usd  # type: ignore
+    # Validate country_id / carrier_id and the numeric fields
+    country, carrier = _load_plan_references(
+        db, payload.country_id or plan.country_id, payload.carrier_id or plan.carrier_id
+    )
 
-    if payload.description is not None:
-        plan.description = payload.description  # type: ignore
+    if payload.duration_days is not None and payload.duration_days <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duration must be positive",
+        )
 
-    if payload.is_unlimited is not None:
-        plan.is_unlimited = payload.is_unlimited  # type: ignore
+    if payload.price_usd is not None and payload.price_usd < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Price must be non-negative",
+        )
 
+    # Apply every provided field; None means "leave unchanged"
+    changes = payload.model_dump(
+        exclude_none=True, exclude={"country_id", "carrier_id"}
+    )
+    for field in ("data_gb", "price_usd"):
+        if field in changes:
+            changes[field] = _to_column_scale(changes[field])
+    for field, value in changes.items():
+        setattr(plan, field, value)
+    plan.country = country
+    plan.carrier = carrier
+
+    body = PlanRead.model_validate(plan).model_dump()
     db.commit()
-    db.refresh(plan)
+    admin_cache.invalidate("plans")
+    admin_cache.invalidate("inventory_stats")  # Low-stock alerts show plan names
 
-    return PlanRead.model_validate(plan)
+    return ORJSONResponse(body)
 
 
 @router.delete("/plans/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -526,7 +549,7 @@ def delete_plan(
     _: User = Depends(get_current_admin),
 ):
     """Delete a plan (admin only)."""
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+    plan = db.get(Plan, plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
 
@@ -535,6 +558,8 @@ def delete_plan(
 
     db.delete(plan)
     db.commit()
+    admin_cache.invalidate("plans")
+    admin_cache.invalidate("inventory_stats")  # Low-stock alerts show plan names
 
 
 # ========================================
@@ -543,59 +568,43 @@ def delete_plan(
 
 
 @router.get("/plans/export")
-async def export_plans_csv(
+def export_plans_csv(
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
     """Export all plans to CSV (admin only)."""
-    plans = db.query(Plan).all()
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow(
-        [
-            "id",
-            "name",
-            "country_id",
-            "carrier_id",
-            "data_gb",
-            "is_unlimited",
-            "duration_days",
-            "price_usd",
-            "description",
-        ]
-    )
 
-    # Write data
-    for plan in plans:
-        writer.writerow(
-            [
-                plan.id,
-                plan.name,
-                plan.country_id,
-                plan.carrier_id,
-                str(plan.data_gb),
-                plan.is_unlimited,
-                plan.duration_days,
-                str(plan.price_usd),
-                plan.description or "",
-            ]
+    def generate_rows():
+        # Server-side cursor + bounded buffer: memory stays flat for any size.
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(PLAN_CSV_HEADER)
+
+        result = db.execute(
+            select(*PLAN_CSV_COLUMNS)
+            .order_by(Plan.id)
+            .execution_options(yield_per=CSV_EXPORT_BATCH_SIZE)
         )
+        # Rows are written as fetched: csv.writer renders Decimal via str() and
+        # None as "", which is the export format, so each batch goes through a
+        # single C-level writerows call.
+        for batch in result.partitions():
+            writer.writerows(batch)
+            if output.tell() >= CSV_EXPORT_CHUNK_BYTES:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+        yield output.getvalue()
 
-    # Return as streaming response
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=plans_export.csv"},
     )
 
 
 @router.post("/plans/import")
-async def import_plans_csv(
+def import_plans_csv(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
@@ -607,13 +616,12 @@ async def import_plans_csv(
         )
 
     # Read CSV
-    contents = await file.read()
-    csv_text = contents.decode("utf-8")
-    csv_reader = csv.DictReader(io.StringIO(csv_text))
+    csv_reader = csv.DictReader(_csv_text_stream(file))
 
     created_count = 0
     updated_count = 0
-    errors = []
+    errors: list[tuple[int, str]] = []
+    parsed_rows: list[tuple[int, dict[str, Any], int | None]] = []
 
     for row_num, row in enumerate(
         csv_reader, start=2
@@ -630,7 +638,9 @@ async def import_plans_csv(
             ]
             missing = [f for f in required if not row.get(f)]
             if missing:
-                errors.append(f"Row {row_num}: Missing fields: {', '.join(missing)}")
+                errors.append(
+                    (row_num, f"Row {row_num}: Missing fields: {', '.join(missing)}")
+                )
                 continue
 
             # Parse data
@@ -645,57 +655,82 @@ async def import_plans_csv(
                 "price_usd": Decimal(row["price_usd"]),
                 "description": row.get("description", "").strip() or None,
             }
+            plan_id = row.get("id")
+            parsed_rows.append(
+                (
+                    row_num,
+                    plan_data,
+                    int(plan_id) if plan_id and plan_id.strip() else None,
+                )
+            )
 
-            # Validate country exists
-            country = (
-                db.query(Country).filter(Country.id == plan_data["country_id"]).first()
+        except ValueError as exc:
+            errors.append((row_num, f"Row {row_num}: Invalid data format - {exc}"))
+        except (KeyError, TypeError) as exc:
+            errors.append(
+                (row_num, f"Row {row_num}: Missing or invalid column - {exc}")
             )
-            if not country:
-                errors.append(
-                    f"Row {row_num}: Country ID {plan_data['country_id']} not found"
-                )
-                continue
 
-            # Validate carrier exists
-            carrier = (
-                db.query(Carrier).filter(Carrier.id == plan_data["carrier_id"]).first()
+    # Resolve every referenced country, carrier and plan up front instead of
+    # querying per row.
+    country_ids = _existing_ids(
+        db, Country.id, {data["country_id"] for _, data, _ in parsed_rows}
+    )
+    carrier_ids = _existing_ids(
+        db, Carrier.id, {data["carrier_id"] for _, data, _ in parsed_rows}
+    )
+    plan_ids = _existing_ids(
+        db, Plan.id, {plan_id for _, _, plan_id in parsed_rows if plan_id is not None}
+    )
+    new_plans: list[dict[str, Any]] = []
+    plan_updates: list[dict[str, Any]] = []
+
+    for row_num, plan_data, plan_id in parsed_rows:
+        if plan_data["country_id"] not in country_ids:
+            errors.append(
+                (
+                    row_num,
+                    f"Row {row_num}: Country ID {plan_data['country_id']} not found",
+                )
             )
-            if not carrier:
-                errors.append(
-                    f"Row {row_num}: Carrier ID {plan_data['carrier_id']} not found"
+            continue
+
+        if plan_data["carrier_id"] not in carrier_ids:
+            errors.append(
+                (
+                    row_num,
+                    f"Row {row_num}: Carrier ID {plan_data['carrier_id']} not found",
                 )
-                continue
+            )
+            continue
 
-            # Check if plan exists (by id if provided, or create new)
-            plan_id = row.get("id")
-            if plan_id and plan_id.strip():
-                # Update existing
-                plan = db.query(Plan).filter(Plan.id == int(plan_id)).first()
-                if plan:
-                    for key, value in plan_data.items():
-                        setattr(plan, key, value)
-                    updated_count += 1
-                else:
-                    errors.append(
-                        f"Row {row_num}: Plan ID {plan_id} not found for update"
-                    )
-                    continue
+        if plan_id is not None:
+            # Update existing
+            if plan_id in plan_ids:
+                plan_updates.append({"id": plan_id, **plan_data})
+                updated_count += 1
             else:
-                # Create new
-                plan = Plan(**plan_data)
-                db.add(plan)
-                created_count += 1
+                errors.append(
+                    (row_num, f"Row {row_num}: Plan ID {plan_id} not found for update")
+                )
+        else:
+            # Create new
+            new_plans.append(plan_data)
+            created_count += 1
 
-        except ValueError as exc:
-            errors.append(f"Row {row_num}: Invalid data format - {exc}")
-        except (KeyError, TypeError) as exc:
-            errors.append(f"Row {row_num}: Missing or invalid column - {exc}")
-        except SQLAlchemyError as exc:
-            errors.append(f"Row {row_num}: Database error - {exc}")
+    errors.sort(key=lambda error: error[0])
 
     # Commit if no errors
     if not errors:
+        # Batched executemany INSERT/UPDATE instead of one unit-of-work
+        # object per row.
+        if new_plans:
+            db.execute(insert(Plan), new_plans)
+        if plan_updates:
+            db.execute(update(Plan), plan_updates)
         db.commit()
+        admin_cache.invalidate("plans")
+        admin_cache.invalidate("inventory_stats")  # Low-stock alerts show plan names
         return {
             "success": True,
             "created": created_count,
@@ -708,7 +743,7 @@ async def import_plans_csv(
             "success": False,
             "created": 0,
             "updated": 0,
-            "errors": errors[:10],  # Limit to first 10 errors
+            "errors": [message for _, message in errors[:10]],  # Limit to first 10
         }
 
 
@@ -717,7 +752,7 @@ async def import_plans_csv(
 # ========================================
 
 
-@router.get("/orders", response_model=PaginatedResponse)
+@router.get("/orders", responses={200: {"model": PaginatedResponse}})
 def list_orders(
     order_status: str | None = Query(None, description="Filter by order status"),
     payment_status: str
@@ -735,19 +770,34 @@ def list_orders(
         "created_at", description="Sort field: created_at, amount, status"
     ),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(
+        True, description="Set false to skip counting matches (total is null)"
+    ),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
-    query = (
-        db.query(Order)
-        .options(
-            joinedload(Order.user),
-            joinedload(Order.plan),
-            joinedload(Order.esim_profile).joinedload(EsimProfile.inventory_item),
-            joinedload(Order.payments),
+    query = db.query(Order)
+    if user_q:
+        # Filter on a plain join and hydrate Order.user from the same row,
+        # rather than an EXISTS subquery plus a second join to eager-load.
+        search_term = f"%{user_q}%"
+        query = query.join(Order.user).filter(
+            or_(User.email.ilike(search_term), User.name.ilike(search_term))
         )
-        .order_by(None)
-    )
+        user_loader = contains_eager(Order.user)
+    else:
+        user_loader = joinedload(Order.user)
+
+    query = query.options(
+        user_loader,
+        joinedload(Order.esim_profile),
+        selectinload(Order.payments),
+        # _serialize_admin_order reads nothing else; fail loudly instead
+        # of issuing a lazy SELECT per order if that changes.
+        raiseload("*"),
+    ).order_by(None)
 
     if order_status:
         status_enum = _parse_enum(OrderStatus, order_status, "order status")
@@ -757,17 +807,6 @@ def list_orders(
         payment_enum = _parse_enum(PaymentStatus, payment_status, "payment status")
         query = query.filter(Order.payments.any(Payment.status == payment_enum))
 
-    if user_q:
-        search_term = f"%{user_q}%"
-        query = query.filter(
-            Order.user.has(
-                or_(
-                    User.email.ilike(search_term),
-                    User.name.ilike(search_term),
-                )
-            )
-        )
-
     if plan_id is not None:
         query = query.filter(Order.plan_id == plan_id)
 
@@ -777,32 +816,27 @@ def list_orders(
     if end_date:
         query = query.filter(Order.created_at <= end_date)
 
-    sort_map = {
-        "created_at": Order.created_at,
-        "amount": Order.amount_minor_units,
-        "status": Order.status,
-    }
-    sort_column = sort_map.get(sort_by, Order.created_at)
-    sort_expression = (
-        sort_column.desc() if sort_order.lower() == "desc" else sort_column.asc()
+    orders, total, next_cursor = _sorted_page(
+        query,
+        ORDER_SORT_COLUMNS.get(sort_by, Order.created_at),
+        Order.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+        with_total=include_total,
     )
 
-    total = query.count()
-    offset = (page - 1) * page_size
-    orders = query.order_by(sort_expression).offset(offset).limit(page_size).all()
-
     payload = [_serialize_admin_order(order) for order in orders]
 
-    return {
-        "items": payload,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    return ORJSONResponse(
+        _page_payload(
+            ORDER_LIST_ADAPTER.dump_python(payload), total, page, page_size, next_cursor
+        )
+    )
 
 
-@router.get("/orders/{order_id}", response_model=AdminOrderRead)
+@router.get("/orders/{order_id}", responses={200: {"model": AdminOrderRead}})
 def get_order_detail(
     order_id: int,
     db: Session = Depends(get_db),
@@ -812,9 +846,11 @@ def get_order_detail(
         db.query(Order)
         .options(
             joinedload(Order.user),
-            joinedload(Order.plan),
-            joinedload(Order.esim_profile).joinedload(EsimProfile.inventory_item),
-            joinedload(Order.payments),
+            joinedload(Order.esim_profile),
+            selectinload(Order.payments),
+            # _serialize_admin_order reads nothing else; fail loudly instead
+            # of issuing a lazy SELECT per order if that changes.
+            raiseload("*"),
         )
         .filter(Order.id == order_id)
         .first()
@@ -822,10 +858,10 @@ def get_order_detail(
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    return _serialize_admin_order(order)
+    return ORJSONResponse(_serialize_admin_order(order).model_dump())
 
 
-@router.get("/payments", response_model=PaginatedResponse)
+@router.get("/payments", responses={200: {"model": PaginatedResponse}})
 def list_payments(
     provider: str | None = Query(None, description="Filter by provider"),
     payment_status: str | None = Query(None, description="Filter by status"),
@@ -836,6 +872,11 @@ def list_payments(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(
+        True, description="Set false to skip counting matches (total is null)"
+    ),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
@@ -846,8 +887,10 @@ def list_payments(
     )
 
     if provider:
-        provider_normalized = provider.upper()
-        query = query.filter(func.upper(Payment.provider) == provider_normalized)
+        # payments.provider is an indexed VARCHAR holding the member name;
+        # a plain equality keeps the (provider, status, created_at) index usable.
+        provider_enum = _parse_enum(PaymentProvider, provider, "payment provider")
+        query = query.filter(Payment.provider == provider_enum)
 
     if payment_status:
         status_enum = _parse_enum(PaymentStatus, payment_status, "payment status")
@@ -866,25 +909,24 @@ def list_payments(
     if end_date:
         query = query.filter(Payment.created_at <= end_date)
 
-    sort_expression = (
-        Payment.created_at.desc()
-        if sort_order.lower() == "desc"
-        else Payment.created_at.asc()
+    payments, total, next_cursor = _sorted_page(
+        query,
+        Payment.created_at,
+        Payment.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+        with_total=include_total,
     )
 
-    total = query.count()
-    offset = (page - 1) * page_size
-    payments = query.order_by(sort_expression).offset(offset).limit(page_size).all()
-
     items = [_serialize_admin_payment(payment) for payment in payments]
 
-    return {
-        "items": items,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    return ORJSONResponse(
+        _page_payload(
+            PAYMENT_LIST_ADAPTER.dump_python(items), total, page, page_size, next_cursor
+        )
+    )
 
 
 # ========================================
@@ -892,7 +934,7 @@ def list_payments(
 # ========================================
 
 
-@router.get("/esims", response_model=PaginatedResponse)
+@router.get("/esims", responses={200: {"model": PaginatedResponse}})
 def list_esim_profiles(
     esim_status: str | None = Query(None, description="Filter by eSIM status"),
     user_q: str | None = Query(None, description="Search by user email or name"),
@@ -902,34 +944,35 @@ def list_esim_profiles(
     | None = Query(None, description="Filter by associated inventory status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(
+        True, description="Set false to skip counting matches (total is null)"
+    ),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
-    query = (
-        db.query(EsimProfile)
-        .options(
-            joinedload(EsimProfile.user),
-            joinedload(EsimProfile.order).joinedload(Order.plan),
-            joinedload(EsimProfile.inventory_item),
+    query = db.query(EsimProfile)
+    if user_q:
+        # Same as list_orders: one join serves both the filter and the load.
+        search_term = f"%{user_q}%"
+        query = query.join(EsimProfile.user).filter(
+            or_(User.email.ilike(search_term), User.name.ilike(search_term))
         )
-        .order_by(None)
-    )
+        user_loader = contains_eager(EsimProfile.user)
+    else:
+        user_loader = joinedload(EsimProfile.user)
+
+    query = query.options(
+        user_loader,
+        joinedload(EsimProfile.order).joinedload(Order.plan),
+        joinedload(EsimProfile.inventory_item),
+    ).order_by(None)
 
     if esim_status:
         status_enum = _parse_enum(EsimStatus, esim_status, "esim status")
         query = query.filter(EsimProfile.status == status_enum)
 
-    if user_q:
-        search_term = f"%{user_q}%"
-        query = query.filter(
-            EsimProfile.user.has(
-                or_(
-                    User.email.ilike(search_term),
-                    User.name.ilike(search_term),
-                )
-            )
-        )
-
     if order_id is not None:
         query = query.filter(EsimProfile.order_id == order_id)
 
@@ -944,27 +987,27 @@ def list_esim_profiles(
             EsimProfile.inventory_item.has(EsimInventory.status == inventory_enum)
         )
 
-    total = query.count()
-    offset = (page - 1) * page_size
-    profiles = (
-        query.order_by(EsimProfile.created_at.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
+    profiles, total, next_cursor = _sorted_page(
+        query,
+        EsimProfile.created_at,
+        EsimProfile.id,
+        descending=True,
+        page=page,
+        page_size=page_size,
+        after=after,
+        with_total=include_total,
     )
 
     items = [_serialize_admin_esim(profile) for profile in profiles]
 
-    return {
-        "items": items,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    return ORJSONResponse(
+        _page_payload(
+            ESIM_LIST_ADAPTER.dump_python(items), total, page, page_size, next_cursor
+        )
+    )
 
 
-@router.get("/inventory", response_model=PaginatedResponse)
+@router.get("/inventory", responses={200: {"model": PaginatedResponse}})
 def list_inventory(
     inventory_status: str
     | None = Query(None, description="Filter by inventory status"),
@@ -978,6 +1021,11 @@ def list_inventory(
         "created_at", description="Sort field: created_at, status, plan_id"
     ),
     sort_order: str = Query("desc", description="Sort order"),
+    after: str
+    | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(
+        True, description="Set false to skip counting matches (total is null)"
+    ),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_admin),
 ):
@@ -1007,85 +1055,96 @@ def list_inventory(
             )
         )
 
-    sort_map = {
-        "created_at": EsimInventory.created_at,
-        "status": EsimInventory.status,
-        "plan_id": EsimInventory.plan_id,
-    }
-    sort_column = sort_map.get(sort_by, EsimInventory.created_at)
-    sort_expression = (
-        sort_column.desc() if sort_order.lower() == "desc" else sort_column.asc()
-    )
-
-    total = query.count()
-    offset = (page - 1) * page_size
-    inventory_items = (
-        query.order_by(sort_expression).offset(offset).limit(page_size).all()
+    inventory_items, total, next_cursor = _sorted_page(
+        query,
+        INVENTORY_SORT_COLUMNS.get(sort_by, EsimInventory.created_at),
+        EsimInventory.id,
+        descending=sort_order.lower() == "desc",
+        page=page,
+        page_size=page_size,
+        after=after,
+        with_total=include_total,
     )
 
     items = [_serialize_inventory_item(item) for item in inventory_items]
 
-    return {
-        "items": items,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
-    }
+    return ORJSONResponse(
+        _page_payload(
+            INVENTORY_LIST_ADAPTER.dump_python(items),
+            total,
+            page,
+            page_size,
+            next_cursor,
+        )
+    )
 
 
-@router.get("/inventory/stats", response_model=AdminInventoryStats)
+@router.get("/inventory/stats", responses={200: {"model": AdminInventoryStats}})
 def inventory_stats(
+    request: Request,
     low_stock_threshold: int = Query(10, ge=1, le=1000, description="Alert threshold"),
     db: Session = Depends(get_db),
     _admin: User = Depends(get_current_admin),
 ):
+    # Dropped on inventory imports and eSIM activations. Other workers catch
+    # up once their entry expires (ADMIN_CACHE_TTL_SECONDS).
+    cache_key = ("inventory_stats", low_stock_threshold)
+    cached = admin_cache.get(cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     totals: dict[str, int] = {status.value: 0 for status in EsimInventoryStatus}
-    status_counts: defaultdict[str, int] = defaultdict(int)
-    for (status_value,) in db.query(EsimInventory.status).all():
-        key = (
-            status_value.value if hasattr(status_value, "value") else str(status_value)
-        )
-        status_counts[key] += 1
-    for key, count in status_counts.items():
+    status_counts = (
+        db.query(EsimInventory.status, func.count())
+        .group_by(EsimInventory.status)
+        .all()
+    )
+    for status_value, count in status_counts:
+        key = _enum_str(status_value)
         totals[key] = count
 
-    available_rows = (
-        db.query(EsimInventory.plan_id, Plan.name)
-        .join(Plan, Plan.id == EsimInventory.plan_id)
-        .filter(EsimInventory.status == EsimInventoryStatus.AVAILABLE)
+    # Count from the (status, plan_id, ...) index alone, then name only the
+    # few plans that are actually low on stock.
+    available = func.count().label("available")
+    low_stock_rows = (
+        db.query(EsimInventory.plan_id, available)
+        .filter(
+            EsimInventory.status == EsimInventoryStatus.AVAILABLE,
+            EsimInventory.plan_id.is_not(None),
+        )
+        .group_by(EsimInventory.plan_id)
+        .having(available <= low_stock_threshold)
+        .order_by(available)
         .all()
     )
-    plan_counts: Counter[int] = Counter()
     plan_names: dict[int, str] = {}
-    for plan_id, plan_name in available_rows:
-        if plan_id is None:
-            continue
-        plan_id_int = cast(int, plan_id)
-        plan_counts[plan_id_int] += 1
-        if plan_name is not None:
-            plan_names[plan_id_int] = plan_name
-
+    if low_stock_rows:
+        plan_names = dict(
+            db.query(Plan.id, Plan.name)
+            .filter(Plan.id.in_([plan_id for plan_id, _ in low_stock_rows]))
+            .all()
+        )
     alerts = [
         AdminStockAlert(
             plan_id=plan_id,
-            plan_name=plan_names.get(plan_id, "Unknown"),
+            plan_name=plan_names.get(plan_id) or "Unknown",
             available=count,
         )
-        for plan_id, count in plan_counts.items()
-        if count <= low_stock_threshold
+        for plan_id, count in low_stock_rows
     ]
-    alerts.sort(key=lambda alert: alert.available)
 
-    return AdminInventoryStats(
+    stats = AdminInventoryStats(
         totals=totals,
         low_stock_threshold=low_stock_threshold,
         low_stock_alerts=alerts,
     )
+    body = ORJSONResponse(stats.model_dump()).body
+    admin_cache.set(cache_key, body)
+    return etag_json_response(request, body)
 
 
 @router.post("/inventory/import")
-async def import_inventory_csv(
+def import_inventory_csv(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     _admin: User = Depends(get_current_admin),
@@ -1095,15 +1154,24 @@ async def import_inventory_csv(
             status_code=status.HTTP_400_BAD_REQUEST, detail="File must be a CSV"
         )
 
-    contents = await file.read()
-    csv_text = contents.decode("utf-8")
-    csv_reader = csv.DictReader(io.StringIO(csv_text))
+    rows = list(csv.DictReader(_csv_text_stream(file)))
 
     created = 0
     updated = 0
     errors: list[str] = []
 
-    for row_num, row in enumerate(csv_reader, start=2):
+    # One lookup for every activation code in the file instead of one per row.
+    inventory_ids = _id_map(
+        db,
+        EsimInventory.activation_code,
+        {(row.get("activation_code") or "").strip() for row in rows} - {""},
+    )
+    # Keyed so a code repeated in the file updates the earlier row instead of
+    # inserting a duplicate.
+    new_items: dict[str, dict[str, Any]] = {}
+    item_updates: dict[int, dict[str, Any]] = {}
+
+    for row_num, row in enumerate(rows, start=2):
         try:
             activation_code = (row.get("activation_code") or "").strip()
             if not activation_code:
@@ -1119,12 +1187,6 @@ async def import_inventory_csv(
             carrier_id = int(row["carrier_id"]) if row.get("carrier_id") else None
             country_id = int(row["country_id"]) if row.get("country_id") else None
 
-            inventory = (
-                db.query(EsimInventory)
-                .filter(EsimInventory.activation_code == activation_code)
-                .first()
-            )
-
             payload = {
                 "plan_id": plan_id,
                 "carrier_id": carrier_id,
@@ -1137,13 +1199,15 @@ async def import_inventory_csv(
                 "provider_reference": (row.get("provider_reference") or None),
             }
 
-            if inventory:
-                for key, value in payload.items():
-                    setattr(inventory, key, value)
+            inventory_id = inventory_ids.get(activation_code)
+            if inventory_id is not None:
+                item_updates[inventory_id] = {"id": inventory_id, **payload}
+                updated += 1
+            elif activation_code in new_items:
+                new_items[activation_code] = payload
                 updated += 1
             else:
-                inventory = EsimInventory(**payload)
-                db.add(inventory)
+                new_items[activation_code] = payload
                 created += 1
 
         except ValueError as exc:
@@ -1160,7 +1224,12 @@ async def import_inventory_csv(
             "errors": errors[:10],
         }
 
+    if new_items:
+        db.execute(insert(EsimInventory), list(new_items.values()))
+    if item_updates:
+        db.execute(update(EsimInventory), list(item_updates.values()))
     db.commit()
+    admin_cache.invalidate("inventory_stats")
     return {
         "success": True,
         "created": created,
@@ -1174,65 +1243,331 @@ async def import_inventory_csv(
 # ========================================
 
 
-def _parse_enum(enum_cls, value: str, field_name: str):
-    normalized = value.strip().lower()
+def _exists(db: Session, query) -> bool:
+    """Return whether ``query`` matches any row, without loading it."""
+    return bool(db.query(query.exists()).scalar())
+
+
+def _delete_or_conflict(db: Session, obj: Any, label: str, plan_filter) -> None:
+    """Delete and commit ``obj``, turning a foreign-key rejection into a 409.
+
+    Plans are only counted once the database has refused the delete, so the
+    common case is a single DELETE.
+    """
+    db.delete(obj)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        plans_count = db.query(Plan.id).filter(plan_filter).count()
+        detail = (
+            f"Cannot delete {label}: {plans_count} plan(s) reference it"
+            if plans_count
+            else f"Cannot delete {label}: other records reference it"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=detail
+        ) from None
+
+
+def _flush_unique(db: Session, conflict_detail: str) -> None:
+    """Flush pending writes, turning a unique-constraint violation into a 409."""
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=conflict_detail
+        ) from None
+
+
+def _load_plan_references(
+    db: Session, country_id: int, carrier_id: int
+) -> tuple[Country, Carrier]:
+    """Fetch a plan's country and carrier in one query, or raise 404.
+
+    The rows are assigned to the plan so ``PlanRead`` can nest them without
+    lazy-loading either relation.
+    """
+    row = db.execute(
+        select(Country, Carrier)
+        .outerjoin(Carrier, Carrier.id == carrier_id)
+        .where(Country.id == country_id)
+    ).first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Country with ID {country_id} not found",
+        )
+    if row.Carrier is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Carrier with ID {carrier_id} not found",
+        )
+    return row.Country, row.Carrier
+
+
+def _to_column_scale(value: float) -> Decimal:
+    """Round to the 2-decimal scale of the plan NUMERIC columns, as MySQL does."""
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _csv_text_stream(file: UploadFile) -> io.TextIOWrapper:
+    """Decode an uploaded CSV incrementally instead of reading it into memory."""
+    return io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+
+
+def _existing_ids(db: Session, id_column, ids: set[int]) -> set[int]:
+    """Return which of ``ids`` exist in ``id_column``, in IN-list batches."""
+    found: set[int] = set()
+    ordered = sorted(ids)
+    for start in range(0, len(ordered), IMPORT_LOOKUP_BATCH_SIZE):
+        batch = ordered[start : start + IMPORT_LOOKUP_BATCH_SIZE]
+        found.update(db.scalars(select(id_column).where(id_column.in_(batch))))
+    return found
+
+
+def _id_map(db: Session, column, keys: set[Any]) -> dict[Any, int]:
+    """Map each of ``keys`` found in ``column`` to its row id.
+
+    When several rows share a key the lowest id wins, as ``.first()`` would.
+    """
+    id_column = column.class_.id
+    found: dict[Any, int] = {}
+    ordered = sorted(keys)
+    for start in range(0, len(ordered), IMPORT_LOOKUP_BATCH_SIZE):
+        batch = ordered[start : start + IMPORT_LOOKUP_BATCH_SIZE]
+        rows = db.execute(
+            select(column, id_column).where(column.in_(batch)).order_by(id_column)
+        )
+        for key, row_id in rows:
+            found.setdefault(key, row_id)
+    return found
+
+
+def _dump_page(adapter: TypeAdapter[list[Any]], items: list[Any]) -> list[Any]:
+    return adapter.dump_python(adapter.validate_python(items, from_attributes=True))
+
+
+def _page_payload(
+    items: list[Any],
+    total: int | None,
+    page: int,
+    page_size: int,
+    next_cursor: str | None = None,
+) -> dict[str, Any]:
+    """Build the ``PaginatedResponse`` body shared by the admin list endpoints."""
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (
+            (total + page_size - 1) // page_size if total is not None else None
+        ),
+        "next_cursor": next_cursor,
+    }
+
+
+def _paginate(query, page: int, page_size: int) -> tuple[list[Any], int]:
+    """Fetch one page of ``query`` and its total match count in one round trip.
+
+    ``query`` must select a single entity and already be sorted.
+    """
+    rows = (
+        query.add_columns(func.count().over())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+    if page == 1:
+        return [], 0
+    # Past the last page there is no row to carry the window count.
+    return [], query.order_by(None).count()
+
+
+def _sorted_page(
+    query,
+    sort_column,
+    id_column,
+    *,
+    descending: bool,
+    page: int,
+    page_size: int,
+    after: str | None,
+    with_total: bool = True,
+) -> tuple[list[Any], int | None, str | None]:
+    """Sort ``query`` by ``sort_column`` (ties broken by id) and fetch one page.
+
+    Without ``after`` this is OFFSET paging via ``_paginate``. With a cursor
+    from a previous page's ``next_cursor`` the page starts right after that
+    row instead (keyset paging), so deep pages cost the same as the first.
+    ``with_total=False`` skips counting matches: one extra row is fetched to
+    tell whether a next page exists and the total comes back as ``None``.
+    Enum-typed columns only page by offset. esim_inventory.status is a native
+    MySQL ENUM, which sorts by member position but compares to a cursor value
+    as text, so a keyset would skip or repeat rows; orders.status (VARCHAR)
+    follows the same rule so every status sort behaves alike. For them
+    ``after`` is rejected, no ``next_cursor`` is issued and the total is
+    always counted.
+    Returns ``(items, total, next_cursor)``.
+    """
+    keyset = not issubclass(sort_column.type.python_type, Enum)
+    if not keyset:
+        if after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor paging is not available when sorting by "
+                f"{sort_column.key}",
+            )
+        with_total = True
+
+    if descending:
+        ordered = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        ordered = query.order_by(sort_column, id_column)
+
+    predicate = None
+    if after is not None:
+        value, last_id = _decode_cursor(after, sort_column)
+        predicate = _after_cursor(sort_column, id_column, value, last_id, descending)
+
+    total: int | None
+    if not with_total:
+        if predicate is None:
+            ordered = ordered.offset((page - 1) * page_size)
+        else:
+            ordered = ordered.filter(predicate)
+        items = ordered.limit(page_size + 1).all()
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        total = None
+    elif predicate is None:
+        items, total = _paginate(ordered, page, page_size)
+        has_more = page * page_size < total
+    else:
+        # The window count would only see rows past the cursor, so the total
+        # comes from an uncorrelated subquery over the unfiltered search.
+        total_query = (
+            query.enable_eagerloads(False)
+            .with_entities(func.count(id_column))
+            .order_by(None)
+        )
+        rows = (
+            ordered.filter(predicate)
+            .add_columns(total_query.scalar_subquery())
+            .limit(page_size + 1)
+            .all()
+        )
+        items = [row[0] for row in rows[:page_size]]
+        total = rows[0][1] if rows else total_query.scalar()
+        has_more = len(rows) > page_size
+
+    next_cursor = None
+    if keyset and items and has_more:
+        last = items[-1]
+        next_cursor = _encode_cursor(getattr(last, sort_column.key), last.id)
+    return items, total, next_cursor
+
+
+def _after_cursor(sort_column, id_column, value: Any, last_id: int, descending: bool):
+    """Match the rows that sort after ``(value, last_id)``.
+
+    MySQL and SQLite both order NULL below every value, so NULLs lead an
+    ascending sort and trail a descending one; the predicate follows suit
+    instead of letting ``col < NULL`` silently drop them.
+    """
+    nullable = sort_column.expression.nullable
+    if value is None:
+        if descending:
+            return and_(sort_column.is_(None), id_column < last_id)
+        return or_(
+            and_(sort_column.is_(None), id_column > last_id),
+            sort_column.is_not(None),
+        )
+    if descending:
+        predicate = or_(
+            sort_column < value, and_(sort_column == value, id_column < last_id)
+        )
+        return or_(predicate, sort_column.is_(None)) if nullable else predicate
+    return or_(sort_column > value, and_(sort_column == value, id_column > last_id))
+
+
+def _encode_cursor(value: Any, row_id: int) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps([value, row_id], default=str)).decode()
+
+
+def _decode_cursor(cursor: str, sort_column) -> tuple[Any, int]:
+    try:
+        value, row_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if value is None:
+            return None, int(row_id)
+        python_type = sort_column.type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(value), int(row_id)
+        return python_type(value), int(row_id)
+    except (ValueError, TypeError, ArithmeticError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
+@lru_cache(maxsize=None)
+def _enum_lookup(enum_cls) -> dict[str, Any]:
+    """Map case-folded member names and values to members, built once per enum."""
+    lookup: dict[str, Any] = {}
     for member in enum_cls:
-        if member.name.lower() == normalized or member.value.lower() == normalized:
-            return member
+        lookup.setdefault(member.name.casefold(), member)
+        lookup.setdefault(str(member.value).casefold(), member)
+    return lookup
+
+
+def _enum_str(value: Any) -> str:
+    """Render an Enum column value (or a raw string from the DB) as text."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+def _parse_enum(enum_cls, value: str, field_name: str):
+    member = _enum_lookup(enum_cls).get(value.strip().casefold())
+    if member is not None:
+        return member
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=f"Invalid {field_name}: {value}",
     )
 
 
+# These serializers copy typed ORM columns into response models, so they use
+# model_construct: validating every row again would only repeat that work.
+
+
 def _serialize_admin_user(user: User | None) -> AdminUserSummary | None:
     if not user:
         return None
-    return AdminUserSummary(
+    return AdminUserSummary.model_construct(
         id=cast(int, user.id),
         email=cast(str | None, user.email),
         name=cast(str | None, user.name),
     )
 
 
-def _extract_plan_snapshot(order: Order) -> dict[str, Any] | None:
-    snapshot = cast(dict[str, Any] | None, getattr(order, "plan_snapshot", None))
-    if snapshot:
-        return snapshot
-    plan = getattr(order, "plan", None)
-    if not plan:
-        return None
-    return {
-        "id": cast(int, plan.id),
-        "name": plan.name,
-        "country_id": plan.country_id,
-        "carrier_id": plan.carrier_id,
-        "data_gb": float(plan.data_gb) if plan.data_gb is not None else None,
-        "duration_days": plan.duration_days,
-        "price_usd": float(plan.price_usd) if plan.price_usd is not None else None,
-    }
-
-
-def _serialize_admin_payment(payment: Payment) -> AdminPaymentRead:
-    order = getattr(payment, "order", None)
+def _serialize_admin_payment(
+    payment: Payment, order: Order | None = None
+) -> AdminPaymentRead:
+    if order is None:
+        order = getattr(payment, "order", None)
     amount_minor_units = (
         int(order.amount_minor_units)
         if order and order.amount_minor_units is not None
         else 0
     )
     currency = str(order.currency) if order and order.currency else None
-    provider = (
-        payment.provider.value
-        if hasattr(payment.provider, "value")
-        else str(payment.provider)
-    )
-    status_value = (
-        payment.status.value
-        if hasattr(payment.status, "value")
-        else str(payment.status)
-    )
+    provider = _enum_str(payment.provider)
+    status_value = _enum_str(payment.status)
 
-    return AdminPaymentRead(
+    return AdminPaymentRead.model_construct(
         id=cast(int, payment.id),
         order_id=cast(int, payment.order_id),
         provider=provider,
@@ -1247,10 +1582,8 @@ def _serialize_admin_payment(payment: Payment) -> AdminPaymentRead:
 def _serialize_admin_esim(esim: EsimProfile | None) -> AdminEsimProfileRead | None:
     if not esim:
         return None
-    status_value = (
-        esim.status.value if hasattr(esim.status, "value") else str(esim.status)
-    )
-    return AdminEsimProfileRead(
+    status_value = _enum_str(esim.status)
+    return AdminEsimProfileRead.model_construct(
         id=cast(int, esim.id),
         order_id=cast(int | None, esim.order_id),
         status=status_value,
@@ -1267,30 +1600,26 @@ def _serialize_admin_esim(esim: EsimProfile | None) -> AdminEsimProfileRead | No
 
 
 def _serialize_admin_order(order: Order) -> AdminOrderRead:
-    status_value = (
-        order.status.value if hasattr(order.status, "value") else str(order.status)
-    )
+    status_value = _enum_str(order.status)
     currency = str(order.currency or "USD")
     raw_amount = cast(int | None, order.amount_minor_units)
     amount_minor_units = raw_amount if raw_amount is not None else 0
     user = _serialize_admin_user(getattr(order, "user", None))
+    # Order.payments is loaded newest first (relationship order_by).
     payments = [
-        _serialize_admin_payment(payment)
-        for payment in sorted(
-            getattr(order, "payments", []),
-            key=lambda p: p.created_at or datetime.min,
-            reverse=True,
-        )
+        _serialize_admin_payment(payment, order)
+        for payment in getattr(order, "payments", [])
     ]
 
-    return AdminOrderRead(
+    return AdminOrderRead.model_construct(
         id=cast(int, order.id),
         status=status_value,
         currency=currency,
         amount_minor_units=amount_minor_units,
         created_at=cast(datetime, order.created_at),
         plan_id=cast(int | None, order.plan_id),
-        plan_snapshot=_extract_plan_snapshot(order),
+        # Written at checkout and backfilled for older orders, so no plan load.
+        plan_snapshot=cast(dict[str, Any] | None, order.plan_snapshot),
         user=user,
         payments=payments,
         esim_profile=_serialize_admin_esim(getattr(order, "esim_profile", None)),
@@ -1298,10 +1627,8 @@ def _serialize_admin_order(order: Order) -> AdminOrderRead:
 
 
 def _serialize_inventory_item(item: EsimInventory) -> AdminInventoryRead:
-    status_value = (
-        item.status.value if hasattr(item.status, "value") else str(item.status)
-    )
-    return AdminInventoryRead(
+    status_value = _enum_str(item.status)
+    return AdminInventoryRead.model_construct(
         id=cast(int, item.id),
         plan_id=cast(int | None, item.plan_id),
         carrier_id=cast(int | None, item.carrier_id),
@@ -71,7 +71,7 @@ def get_plans(
 @router.get("/plans/{plan_id}", response_model=PlanDetail)
 def get_plan_detail(plan_id: int, db: Session = Depends(get_db)):
     """Get plan detail by ID."""
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+    plan = db.get(Plan, plan_id)
     if not plan:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Plan not found")
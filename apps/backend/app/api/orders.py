@@ -34,6 +34,7 @@ from ..services.payment_providers import (
     PaymentWebhookValidationError,
     get_payment_provider,
 )
+from ..services.cache import admin_cache
 from ..services.pricing import format_minor_units, to_minor_units
 from .auth import get_current_user
 
@@ -298,7 +299,7 @@ def create_order(
         if existing:
             return OrderRead(**serialize_order(existing))
 
-    plan = db.query(Plan).filter(Plan.id == plan_id).first()
+    plan = db.get(Plan, plan_id)
     if not plan:
         raise HTTPException(status_code=404, detail="Plan not found")
 
@@ -468,7 +469,7 @@ async def payment_webhook(
     setattr(payment, "raw_payload", payload)
 
     # Update order status based on payment
-    order = db.query(Order).filter(Order.id == payment.order_id).first()
+    order = db.get(Order, payment.order_id)
     _update_order_status_from_payment(order, payment_status)
 
     db.commit()
@@ -565,6 +566,8 @@ def activate_esim(
     )
 
     db.commit()
+    # Activation moved an inventory row to ASSIGNED (or created one).
+    admin_cache.invalidate("inventory_stats")
     db.refresh(esim)
 
     return EsimProfileRead(**serialize_esim(esim))
@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "tribi"
     MYSQL_PASSWORD: str = "tribi"
     MYSQL_DB: str = "tribi"
+    DB_POOL_SIZE: int = 20  # Persistent connections per worker process
+    DB_MAX_OVERFLOW: int = 30  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Stay under MySQL's wait_timeout
+    DB_QUERY_CACHE_SIZE: int = 1200  # Compiled SQL statements kept per engine
     BACKEND_PORT: int = 8000
 
     # Auth / JWT
@@ -57,6 +61,7 @@ class Settings(BaseSettings):
 
     # Admin Access
     ADMIN_EMAILS: str = ""  # Comma-separated list of admin emails
+    ADMIN_CACHE_TTL_SECONDS: int = 30  # Admin catalog list cache; 0 disables
 
     @property
     def admin_emails_list(self) -> list[str]:
@@ -0,0 +1,42 @@
+"""Response classes shared by the API routers."""
+
+import hashlib
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+
+def _orjson_default(value: Any) -> Any:
+    # Match jsonable_encoder for the one type orjson does not handle natively.
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    Handlers that already hold plain data (e.g. ``model.model_dump()``) can
+    return this directly to skip FastAPI's ``jsonable_encoder`` pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """Serve a pre-rendered JSON body with a content-hash ``ETag``.
+
+    Answers ``304 Not Modified`` when the client's ``If-None-Match`` already
+    names this body. ``no-cache`` makes browsers revalidate on every request
+    instead of reusing a stale copy.
+    """
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    client_etags = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in client_etags.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
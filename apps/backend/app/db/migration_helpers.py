@@ -0,0 +1,179 @@
+"""Shared helpers for Alembic revision scripts.
+
+Revisions import these as ``from app.db.migration_helpers import ...``;
+``alembic/env.py`` puts the backend root on ``sys.path`` before any revision
+module is loaded.
+"""
+
+import logging
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import op
+
+logger = logging.getLogger("alembic.migration_helpers")
+
+
+def _dialect_name() -> str:
+    return op.get_context().dialect.name
+
+
+def _inspector() -> sa.Inspector | None:
+    if op.get_context().as_sql:
+        # Offline (--sql) runs have no connection to inspect.
+        return None
+    return sa.inspect(op.get_bind())
+
+
+def _index_exists(table: str, name: str) -> bool:
+    inspector = _inspector()
+    if inspector is None or not inspector.has_table(table):
+        return False
+    return any(index["name"] == name for index in inspector.get_indexes(table))
+
+
+def table_exists(table: str) -> bool:
+    inspector = _inspector()
+    return inspector is not None and inspector.has_table(table)
+
+
+def column_exists(table: str, column: str) -> bool:
+    inspector = _inspector()
+    if inspector is None or not inspector.has_table(table):
+        return False
+    return any(existing["name"] == column for existing in inspector.get_columns(table))
+
+
+# The *_if_missing wrappers let an interrupted upgrade be re-run: MySQL commits
+# each DDL statement on its own, so a failed deploy can leave some of a
+# revision's tables/columns/indexes behind.
+
+
+def create_table_if_missing(name: str, *columns: Any, **kw: Any) -> None:
+    if not table_exists(name):
+        op.create_table(name, *columns, **kw)
+
+
+def create_index_if_missing(
+    name: str, table: str, columns: Sequence[str | sa.ColumnElement[Any]], **kw: Any
+) -> None:
+    if not _index_exists(table, name):
+        op.create_index(name, table, list(columns), **kw)
+
+
+def add_column_if_missing(table: str, column: sa.Column) -> None:
+    if not column_exists(table, column.name):
+        op.add_column(table, column)
+
+
+@contextmanager
+def foreign_key_checks_disabled() -> Iterator[None]:
+    """Skip MySQL foreign key validation for the duration of the block.
+
+    Only meant for DDL that creates new, empty tables, where there are no rows
+    to validate. The session setting is restored even if the block fails.
+    Other dialects run the block unchanged.
+    """
+    if _dialect_name() != "mysql":
+        yield
+        return
+
+    op.execute(sa.text("SET foreign_key_checks = 0"))
+    try:
+        yield
+    finally:
+        op.execute(sa.text("SET foreign_key_checks = 1"))
+
+
+def create_index_online(
+    name: str, table: str, columns: Sequence[str], unique: bool = False
+) -> None:
+    """Create an index on a populated table without blocking writes.
+
+    MySQL builds the index in place with ``LOCK=NONE``; PostgreSQL uses
+    ``CREATE INDEX CONCURRENTLY`` outside the migration transaction. Other
+    dialects (SQLite in local dev) fall back to ``op.create_index``. An index
+    that already exists is left alone so a half-applied revision can be re-run.
+    """
+    if _index_exists(table, name):
+        return
+
+    unique_sql = "UNIQUE " if unique else ""
+    column_sql = ", ".join(columns)
+    dialect = _dialect_name()
+
+    if dialect == "mysql":
+        op.execute(
+            sa.text(
+                f"CREATE {unique_sql}INDEX {name} ON {table} ({column_sql}) "
+                "ALGORITHM=INPLACE LOCK=NONE"
+            )
+        )
+    elif dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                sa.text(
+                    f"CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} ({column_sql})"
+                )
+            )
+    else:
+        op.create_index(name, table, list(columns), unique=unique)
+
+
+def drop_index_if_exists(name: str, table: str) -> None:
+    """Drop an index only when it is present (e.g. created by an older revision)."""
+    if op.get_context().as_sql or _index_exists(table, name):
+        op.drop_index(name, table_name=table)
+
+
+def update_in_batches(
+    table: sa.Table,
+    values: dict[str, Any],
+    *criteria: Any,
+    batch_size: int = 10_000,
+) -> None:
+    """Run ``UPDATE table SET values WHERE criteria`` one primary-key range at a time.
+
+    Each batch only locks rows in ``[low, low + batch_size)`` and is committed
+    before the next starts, so large backfills never hold a table-wide lock.
+    ``table`` must expose an integer ``id`` column.
+    """
+    bind = op.get_bind()
+    low, high = bind.execute(
+        sa.select(sa.func.min(table.c.id), sa.func.max(table.c.id))
+    ).one()
+    if low is None:
+        return
+
+    with op.get_context().autocommit_block():
+        for start in range(low, high + 1, batch_size):
+            end = start + batch_size - 1
+            result = bind.execute(
+                table.update()
+                .where(table.c.id.between(start, end), *criteria)
+                .values(**values)
+            )
+            logger.info(
+                "%s: updated %s row(s) in ids %s-%s of %s",
+                table.name,
+                result.rowcount,
+                start,
+                min(end, high),
+                high,
+            )
+
+
+def bulk_seed(
+    table: sa.TableClause, rows: Sequence[dict[str, Any]], batch_size: int = 1_000
+) -> None:
+    """Insert seed rows with one multi-row ``INSERT ... VALUES`` per batch.
+
+    Use this instead of per-row ``op.execute`` in data migrations. ``table`` is
+    a lightweight ``sa.table(...)`` listing the columns present in ``rows``.
+    """
+    for start in range(0, len(rows), batch_size):
+        op.bulk_insert(table, list(rows[start : start + batch_size]), multiinsert=True)
@@ -3,7 +3,16 @@ from sqlalchemy.orm import sessionmaker, Session
 
 from ..core.config import settings
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+    # Each admin list compiles a different statement per filter combination;
+    # keep them all cached rather than recompiling on every request.
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -61,7 +62,7 @@ class EsimInventoryStatus(enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=utcnow)
@@ -75,7 +76,7 @@ class User(Base):
 class AuthCode(Base):
     __tablename__ = "auth_codes"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         Integer, ForeignKey("users.id"), nullable=True, index=True
     )  # Nullable for pre-user codes
@@ -95,7 +96,7 @@ class AuthCode(Base):
 class Order(Base):
     __tablename__ = "orders"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     plan_id = Column(Integer, ForeignKey("plans.id"), nullable=False, index=True)
     status = Column(Enum(OrderStatus), default=OrderStatus.CREATED, nullable=False)
@@ -108,14 +109,27 @@ class Order(Base):
 
     user = relationship("User", back_populates="orders")
     plan = relationship("Plan")
-    payments = relationship("Payment", back_populates="order")
+    payments = relationship(
+        "Payment",
+        back_populates="order",
+        order_by="(Payment.created_at.desc(), Payment.id.desc())",
+    )
     esim_profile = relationship("EsimProfile", back_populates="order", uselist=False)
 
+    __table_args__ = (
+        # Admin order listing: filter by one of these, newest first.
+        Index("ix_orders_status_created", "status", "created_at"),
+        Index("ix_orders_plan_created", "plan_id", "created_at"),
+        Index("ix_orders_user_created", "user_id", "created_at"),
+        # Unfiltered listing and its (created_at, id) keyset cursor.
+        Index("ix_orders_created_id", "created_at", "id"),
+    )
+
 
 class EsimProfile(Base):
     __tablename__ = "esim_profiles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=True, index=True)
@@ -145,11 +159,13 @@ class EsimProfile(Base):
         "EsimInventory", back_populates="profiles", foreign_keys=[inventory_item_id]
     )
 
+    __table_args__ = (Index("ix_esim_profiles_created_id", "created_at", "id"),)
+
 
 class EsimInventory(Base):
     __tablename__ = "esim_inventory"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     plan_id = Column(Integer, ForeignKey("plans.id"), nullable=True, index=True)
     carrier_id = Column(Integer, ForeignKey("carriers.id"), nullable=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=True, index=True)
@@ -165,7 +181,7 @@ class EsimInventory(Base):
         default=EsimInventoryStatus.AVAILABLE,
         nullable=False,
     )
-    extra_metadata = Column("metadata", JSON, nullable=True)
+    extra_metadata = Column(JSON, nullable=True)
     provider_reference = Column(String(128), nullable=True)
     provider_payload = Column(JSON, nullable=True)
     reserved_at = Column(DateTime, nullable=True)
@@ -178,11 +194,18 @@ class EsimInventory(Base):
     carrier = relationship("Carrier")
     profiles = relationship("EsimProfile", back_populates="inventory_item")
 
+    __table_args__ = (
+        Index(
+            "ix_esim_inventory_status_plan_created", "status", "plan_id", "created_at"
+        ),
+        Index("ix_esim_inventory_created_id", "created_at", "id"),
+    )
+
 
 class Payment(Base):
     __tablename__ = "payments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
     provider = Column(Enum(PaymentProvider), nullable=False)
     status = Column(Enum(PaymentStatus), nullable=False)
@@ -195,3 +218,10 @@ class Payment(Base):
     order = relationship("Order", back_populates="payments")
 
     order = relationship("Order", back_populates="payments")
+
+    __table_args__ = (
+        Index(
+            "ix_payments_provider_status_created", "provider", "status", "created_at"
+        ),
+        Index("ix_payments_created_id", "created_at", "id"),
+    )
@@ -1,4 +1,14 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, Text, ForeignKey, Index
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Numeric,
+    Boolean,
+    Text,
+    ForeignKey,
+    Index,
+    func,
+)
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -7,11 +17,12 @@ Base = declarative_base()
 class Country(Base):
     __tablename__ = "countries"
 
-    id = Column(Integer, primary_key=True, index=True)
-    iso2 = Column(String(2), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    iso2 = Column(String(2), unique=True, nullable=False)
     name = Column(String(255), nullable=False, index=True)
 
-    plans = relationship("Plan", back_populates="country")
+    # Plans block deletion via the FK; don't let the ORM load or null them.
+    plans = relationship("Plan", back_populates="country", passive_deletes="all")
 
     __table_args__ = (
         Index("idx_country_iso2_name", "iso2", "name"),
@@ -21,18 +32,31 @@ class Country(Base):
 class Carrier(Base):
     __tablename__ = "carriers"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, index=True)
 
-    plans = relationship("Plan", back_populates="carrier")
+    plans = relationship("Plan", back_populates="carrier", passive_deletes="all")
+
+    __table_args__ = (
+        # Carrier names are unique regardless of case ("Claro" == "claro").
+        Index("uq_carriers_name_lower", func.lower(name), unique=True),
+    )
 
 
 class Plan(Base):
     __tablename__ = "plans"
 
-    id = Column(Integer, primary_key=True, index=True)
-    country_id = Column(Integer, ForeignKey("countries.id"), nullable=False, index=True)
-    carrier_id = Column(Integer, ForeignKey("carriers.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    # Lookups by country_id are served by idx_plan_country_carrier.
+    country_id = Column(
+        Integer, ForeignKey("countries.id", ondelete="RESTRICT"), nullable=False
+    )
+    carrier_id = Column(
+        Integer,
+        ForeignKey("carriers.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+    )
     name = Column(String(255), nullable=False)
     data_gb = Column(Numeric(5, 2), nullable=False)
     duration_days = Column(Integer, nullable=False)
@@ -46,4 +70,6 @@ class Plan(Base):
     __table_args__ = (
         Index("idx_plan_country_carrier", "country_id", "carrier_id"),
         Index("idx_plan_price", "price_usd"),
+        # Serves "plans for country X, cheapest first" without a filesort.
+        Index("idx_plan_country_price", "country_id", "price_usd"),
     )
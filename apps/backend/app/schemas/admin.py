@@ -1,20 +1,30 @@
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from typing import Annotated, Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 # ========================================
 # Country Schemas
 # ========================================
 
 
+def _normalize_iso2(value: str) -> str:
+    value = value.upper()
+    if len(value) != 2 or not value.isalpha():
+        raise ValueError("ISO2 must be exactly 2 uppercase letters")
+    return value
+
+
+ISO2Code = Annotated[str, AfterValidator(_normalize_iso2)]
+
+
 class CountryCreate(BaseModel):
-    iso2: str = Field(..., description="Two-letter country code")
+    iso2: ISO2Code = Field(..., description="Two-letter country code")
     name: str = Field(..., min_length=1, max_length=255, description="Country name")
 
 
 class CountryUpdate(BaseModel):
-    iso2: str | None = Field(None, description="Two-letter country code")
+    iso2: ISO2Code | None = Field(None, description="Two-letter country code")
     name: str | None = Field(
         None, min_length=1, max_length=255, description="Country name"
     )
@@ -73,10 +83,16 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    # Both None when the caller passed ``include_total=false``, unless the
+    # list is sorted by an enum column, which always counts.
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    # Opaque keyset cursor for the next page; only set by endpoints that
+    # accept an ``after`` parameter. None on the last page, and always None
+    # when sorting by an enum column (those page by offset only).
+    next_cursor: str | None = None
 
 
 # ========================================
@@ -1,6 +1,8 @@
 import json
 import os
 
+from sqlalchemy import insert, select
+
 from ..db.session import SessionLocal, engine
 from ..models import Base, Country, Carrier, Plan
 
@@ -33,46 +35,37 @@ def seed_database():
 
         print("🌱 Seeding database...")
 
-        # Insert countries
-        countries_map = {}
-        for country_data in data["countries"]:
-            country = Country(**country_data)
-            db.add(country)
-            db.flush()
-            countries_map[country_data["iso2"]] = country
+        # Insert each table with one executemany INSERT instead of a
+        # flush per row, then read back the generated ids by natural key.
+        db.execute(insert(Country), data["countries"])
+        countries_map = dict(db.execute(select(Country.iso2, Country.id)).all())
         print(f"✓ Inserted {len(countries_map)} countries")
 
-        # Insert carriers
-        carriers_map = {}
-        for carrier_data in data["carriers"]:
-            carrier = Carrier(**carrier_data)
-            db.add(carrier)
-            db.flush()
-            carriers_map[carrier_data["name"]] = carrier
+        db.execute(insert(Carrier), data["carriers"])
+        carriers_map = dict(db.execute(select(Carrier.name, Carrier.id)).all())
         print(f"✓ Inserted {len(carriers_map)} carriers")
 
         # Insert plans
+        plan_rows = []
         for plan_data in data["plans"]:
             country_iso2 = plan_data.pop("country_iso2")
             carrier_name = plan_data.pop("carrier_name")
 
-            country = countries_map.get(country_iso2)
-            carrier = carriers_map.get(carrier_name)
+            country_id = countries_map.get(country_iso2)
+            carrier_id = carriers_map.get(carrier_name)
 
-            if not country or not carrier:
+            if not country_id or not carrier_id:
                 print(f"⚠ Skipping plan (missing country or carrier): {plan_data}")
                 continue
 
-            plan = Plan(
-                country_id=country.id,
-                carrier_id=carrier.id,
-                **plan_data,
+            plan_rows.append(
+                {"country_id": country_id, "carrier_id": carrier_id, **plan_data}
             )
-            db.add(plan)
+        if plan_rows:
+            db.execute(insert(Plan), plan_rows)
 
         db.commit()
-        plan_count = db.query(Plan).count()
-        print(f"✓ Inserted {plan_count} plans")
+        print(f"✓ Inserted {len(plan_rows)} plans")
         print("✓ Database seeded successfully!")
 
     except Exception as e:
@@ -0,0 +1,55 @@
+"""In-process TTL cache for rendered admin responses."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable
+
+from ..core.config import settings
+
+
+class ResponseCache:
+    """Map ``(namespace, *params)`` keys to response bodies for a short TTL.
+
+    Each worker process holds its own copy, so writes only invalidate the
+    worker that served them; other workers catch up when the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 512) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[tuple[Hashable, ...], tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return body
+
+    def set(self, key: tuple[Hashable, ...], body: bytes) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop every entry whose key starts with ``namespace``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+admin_cache = ResponseCache(ttl_seconds=settings.ADMIN_CACHE_TTL_SECONDS)
@@ -7,8 +7,9 @@ from app.core.config import settings
 from app.db.session import get_db
 from app.main import app
 from app.models import Base, Carrier, Country, Plan, User
+from app.services.cache import admin_cache
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -19,6 +20,14 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+
+
+@event.listens_for(engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record):
+    # MySQL enforces foreign keys; SQLite only does when asked.
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -35,6 +44,7 @@ def setup_database():
     """Reset database schema before each test and clean up overrides afterwards."""
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    admin_cache.clear()
 
     db = TestingSessionLocal()
     try:
@@ -54,7 +54,7 @@ def test_create_country_invalid_iso2(client, admin_headers):
         json={"iso2": "USA", "name": "United States"},
         headers=admin_headers,
     )
-    assert response.status_code == 400
+    assert response.status_code == 422
 
     # With numbers
     response = client.post(
@@ -62,7 +62,7 @@ def test_create_country_invalid_iso2(client, admin_headers):
         json={"iso2": "U1", "name": "United States"},
         headers=admin_headers,
     )
-    assert response.status_code == 400
+    assert response.status_code == 422
 
 
 def test_create_country_non_admin(client, non_admin_headers):
@@ -99,6 +99,57 @@ def test_list_countries(client, admin_headers):
     assert data["total_pages"] == 2
 
 
+def test_list_countries_page_past_end(client, admin_headers):
+    """Test a page past the last one still reports the total."""
+    client.post(
+        "/admin/countries", json={"iso2": "MX", "name": "Mexico"}, headers=admin_headers
+    )
+
+    response = client.get("/admin/countries?page=3&page_size=1", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 1
+    assert data["total_pages"] == 1
+
+
+def test_list_countries_reflects_writes(client, admin_headers):
+    """Test cached country lists are invalidated by writes."""
+    response = client.get("/admin/countries", headers=admin_headers)
+    assert response.json()["total"] == 0
+
+    created = client.post(
+        "/admin/countries", json={"iso2": "MX", "name": "Mexico"}, headers=admin_headers
+    )
+    response = client.get("/admin/countries", headers=admin_headers)
+    assert response.json()["total"] == 1
+
+    client.delete(f"/admin/countries/{created.json()['id']}", headers=admin_headers)
+    response = client.get("/admin/countries", headers=admin_headers)
+    assert response.json()["total"] == 0
+
+
+def test_list_countries_etag(client, admin_headers):
+    """Test that an unchanged country list revalidates with 304."""
+    first = client.get("/admin/countries", headers=admin_headers)
+    etag = first.headers["etag"]
+
+    response = client.get(
+        "/admin/countries", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    client.post(
+        "/admin/countries", json={"iso2": "PE", "name": "Peru"}, headers=admin_headers
+    )
+    response = client.get(
+        "/admin/countries", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
 def test_list_countries_search(client, admin_headers):
     """Test searching countries."""
     client.post(
@@ -122,6 +173,20 @@ def test_list_countries_search(client, admin_headers):
     assert response.json()["total"] == 1
 
 
+def test_list_countries_search_iso2(client, admin_headers):
+    """Test two-letter searches match ISO2 codes and names alike."""
+    for iso2, name in (("US", "United States"), ("AU", "Australia"), ("MX", "Mexico")):
+        client.post(
+            "/admin/countries", json={"iso2": iso2, "name": name}, headers=admin_headers
+        )
+
+    response = client.get("/admin/countries?q=us", headers=admin_headers)
+    assert {item["iso2"] for item in response.json()["items"]} == {"US", "AU"}
+
+    response = client.get("/admin/countries?q=%20%20", headers=admin_headers)
+    assert response.json()["total"] == 3
+
+
 def test_update_country(client, admin_headers):
     """Test updating a country."""
     # Create
@@ -250,6 +315,26 @@ def test_create_carrier_duplicate(client, admin_headers):
     assert response.status_code == 409
 
 
+def test_carrier_names_unique_ignoring_case(client, admin_headers):
+    """Test carrier names differing only by case conflict on create and update."""
+    client.post("/admin/carriers", json={"name": "Verizon"}, headers=admin_headers)
+
+    response = client.post(
+        "/admin/carriers", json={"name": "verizon"}, headers=admin_headers
+    )
+    assert response.status_code == 409
+
+    other = client.post(
+        "/admin/carriers", json={"name": "Orange"}, headers=admin_headers
+    ).json()
+    response = client.put(
+        f"/admin/carriers/{other['id']}",
+        json={"name": "VERIZON"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 409
+
+
 def test_list_carriers(client, admin_headers):
     """Test listing carriers with pagination."""
     client.post("/admin/carriers", json={"name": "T-Mobile"}, headers=admin_headers)
@@ -503,6 +588,47 @@ def test_list_plans(client, admin_headers):
     assert data["total"] == 3
 
 
+def test_list_plans_keyset_cursor(client, admin_headers):
+    """Test walking plans with next_cursor, including tied sort values."""
+    country_id = client.post(
+        "/admin/countries",
+        json={"iso2": "AU", "name": "Australia"},
+        headers=admin_headers,
+    ).json()["id"]
+    carrier_id = client.post(
+        "/admin/carriers", json={"name": "Telstra"}, headers=admin_headers
+    ).json()["id"]
+    for i, price in enumerate([12.5, 10.0, 12.5, 8.0, 30.0]):
+        client.post(
+            "/admin/plans",
+            json={
+                "country_id": country_id,
+                "carrier_id": carrier_id,
+                "name": f"Plan {i}",
+                "data_gb": 1.0,
+                "duration_days": 7,
+                "price_usd": price,
+            },
+            headers=admin_headers,
+        )
+
+    url = "/admin/plans?sort_by=price_usd&sort_order=desc&page_size=2"
+    first = client.get(url, headers=admin_headers).json()
+    assert first["total"] == 5
+    seen = [item["price_usd"] for item in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        data = client.get(f"{url}&after={cursor}", headers=admin_headers).json()
+        assert data["total"] == 5
+        seen += [item["price_usd"] for item in data["items"]]
+        cursor = data["next_cursor"]
+
+    assert seen == [30.0, 12.5, 12.5, 10.0, 8.0]
+
+    response = client.get(f"{url}&after=not-a-cursor", headers=admin_headers)
+    assert response.status_code == 400
+
+
 def test_list_plans_filter_country(client, admin_headers):
     """Test filtering plans by country."""
     # Create two countries
@@ -588,6 +714,82 @@ def test_update_plan(client, admin_headers):
     assert response.json()["price_usd"] == 12.0
 
 
+def test_plan_responses_show_stored_precision(client, admin_headers):
+    """Test that create/update echo the values rounded by the NUMERIC columns."""
+    country = client.post(
+        "/admin/countries",
+        json={"iso2": "FI", "name": "Finland"},
+        headers=admin_headers,
+    ).json()
+    carrier = client.post(
+        "/admin/carriers", json={"name": "Elisa"}, headers=admin_headers
+    ).json()
+
+    created = client.post(
+        "/admin/plans",
+        json={
+            "country_id": country["id"],
+            "carrier_id": carrier["id"],
+            "name": "Rounding",
+            "data_gb": 2.345,
+            "duration_days": 7,
+            "price_usd": 9.999,
+        },
+        headers=admin_headers,
+    ).json()
+    assert (created["price_usd"], created["data_gb"]) == (10.0, 2.35)
+    assert created["carrier"]["name"] == "Elisa"
+
+    updated = client.put(
+        f"/admin/plans/{created['id']}",
+        json={"price_usd": 19.999, "data_gb": 1.234},
+        headers=admin_headers,
+    ).json()
+    assert updated["price_usd"] == 20.0
+    assert updated["data_gb"] == 1.23
+
+    listed = client.get("/admin/plans", headers=admin_headers).json()["items"][0]
+    assert (listed["price_usd"], listed["data_gb"]) == (20.0, 1.23)
+
+
+def test_list_plans_refreshes_after_carrier_rename(client, admin_headers):
+    """Test that a cached plan list picks up a renamed carrier."""
+    country = client.post(
+        "/admin/countries", json={"iso2": "NO", "name": "Norway"}, headers=admin_headers
+    ).json()
+    carrier = client.post(
+        "/admin/carriers", json={"name": "Telenor"}, headers=admin_headers
+    ).json()
+    client.post(
+        "/admin/plans",
+        json={
+            "country_id": country["id"],
+            "carrier_id": carrier["id"],
+            "name": "Nordic 5GB",
+            "data_gb": 5.0,
+            "duration_days": 7,
+            "price_usd": 10.0,
+        },
+        headers=admin_headers,
+    )
+
+    first = client.get("/admin/plans", headers=admin_headers)
+    assert first.json()["items"][0]["carrier"]["name"] == "Telenor"
+    cached = client.get(
+        "/admin/plans",
+        headers={**admin_headers, "If-None-Match": first.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+    client.put(
+        f"/admin/carriers/{carrier['id']}",
+        json={"name": "Telenor Norge"},
+        headers=admin_headers,
+    )
+    response = client.get("/admin/plans", headers=admin_headers)
+    assert response.json()["items"][0]["carrier"]["name"] == "Telenor Norge"
+
+
 def test_delete_plan(client, admin_headers):
     """Test deleting a plan."""
     # Create plan
@@ -613,3 +815,99 @@ def test_delete_plan(client, admin_headers):
 
     response = client.delete(f"/admin/plans/{plan['id']}", headers=admin_headers)
     assert response.status_code == 204
+
+
+def test_import_plans_csv(client, admin_headers):
+    """Test importing plans: creates, updates and per-row reference errors."""
+    country = client.post(
+        "/admin/countries", json={"iso2": "SE", "name": "Sweden"}, headers=admin_headers
+    ).json()
+    carrier = client.post(
+        "/admin/carriers", json={"name": "Tele2"}, headers=admin_headers
+    ).json()
+    plan = client.post(
+        "/admin/plans",
+        json={
+            "country_id": country["id"],
+            "carrier_id": carrier["id"],
+            "name": "Old Name",
+            "data_gb": 1.0,
+            "duration_days": 7,
+            "price_usd": 5.0,
+        },
+        headers=admin_headers,
+    ).json()
+
+    header = "id,name,country_id,carrier_id,data_gb,duration_days,price_usd\n"
+    csv_body = (
+        header
+        + f"{plan['id']},Renamed,{country['id']},{carrier['id']},2,7,6\n"
+        + f",Fresh,{country['id']},{carrier['id']},3,14,9\n"
+    )
+    response = client.post(
+        "/admin/plans/import",
+        files={"file": ("plans.csv", csv_body, "text/csv")},
+        headers=admin_headers,
+    )
+    assert response.json() == {
+        "success": True,
+        "created": 1,
+        "updated": 1,
+        "errors": [],
+    }
+    updated = client.get(
+        "/admin/plans", params={"q": "Renamed"}, headers=admin_headers
+    ).json()
+    assert updated["items"][0]["id"] == plan["id"]
+
+    csv_body = (
+        header
+        + f",Bad Country,999999,{carrier['id']},3,14,9\n"
+        + ",Bad Number,x,1,3,14,9\n"
+    )
+    response = client.post(
+        "/admin/plans/import",
+        files={"file": ("plans.csv", csv_body, "text/csv")},
+        headers=admin_headers,
+    )
+    data = response.json()
+    assert data["success"] is False
+    assert data["errors"][0] == "Row 2: Country ID 999999 not found"
+    assert data["errors"][1].startswith("Row 3: Invalid data format")
+
+
+def test_export_plans_csv(client, admin_headers):
+    """Test exporting plans as CSV."""
+    country = client.post(
+        "/admin/countries",
+        json={"iso2": "FI", "name": "Finland"},
+        headers=admin_headers,
+    ).json()
+    carrier = client.post(
+        "/admin/carriers", json={"name": "Elisa"}, headers=admin_headers
+    ).json()
+    plan = client.post(
+        "/admin/plans",
+        json={
+            "country_id": country["id"],
+            "carrier_id": carrier["id"],
+            "name": "Export Plan",
+            "data_gb": 5.0,
+            "duration_days": 7,
+            "price_usd": 10.0,
+        },
+        headers=admin_headers,
+    ).json()
+
+    response = client.get("/admin/plans/export", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == (
+        "id,name,country_id,carrier_id,data_gb,is_unlimited,"
+        "duration_days,price_usd,description"
+    )
+    assert (
+        f"{plan['id']},Export Plan,{country['id']},{carrier['id']},5.00,False,7,10.00,"
+        in lines
+    )
@@ -156,6 +156,75 @@ def test_list_orders_filters_and_serializes(client, admin_headers, db_session):
     assert item["esim_profile"]["status"] == "active"
 
 
+def test_list_orders_keyset_cursor(client, admin_headers, db_session):
+    """Orders page by created_at cursor without dropping eager-loaded payments."""
+    plan = _create_plan(db_session)
+    user = _create_user(db_session)
+    orders = [_create_order(db_session, user, plan) for _ in range(3)]
+    for order in orders:
+        _add_payment(db_session, order, intent_id=f"pi_{order.id}_a")
+        _add_payment(db_session, order, intent_id=f"pi_{order.id}_b")
+
+    first = client.get(
+        "/admin/orders", params={"page_size": 2}, headers=admin_headers
+    ).json()
+    assert first["total"] == 3
+    assert [item["id"] for item in first["items"]] == [orders[2].id, orders[1].id]
+    assert all(len(item["payments"]) == 2 for item in first["items"])
+
+    second = client.get(
+        "/admin/orders",
+        params={"page_size": 2, "after": first["next_cursor"]},
+        headers=admin_headers,
+    ).json()
+    assert second["total"] == 3
+    assert [item["id"] for item in second["items"]] == [orders[0].id]
+    assert second["next_cursor"] is None
+
+
+def test_list_orders_without_total(client, admin_headers, db_session):
+    """include_total=false skips the count but still pages by cursor."""
+    plan = _create_plan(db_session)
+    user = _create_user(db_session)
+    orders = [_create_order(db_session, user, plan) for _ in range(3)]
+
+    params = {"page_size": 2, "include_total": "false"}
+    first = client.get("/admin/orders", params=params, headers=admin_headers).json()
+    assert first["total"] is None
+    assert first["total_pages"] is None
+    assert [item["id"] for item in first["items"]] == [orders[2].id, orders[1].id]
+
+    second = client.get(
+        "/admin/orders",
+        params={**params, "after": first["next_cursor"]},
+        headers=admin_headers,
+    ).json()
+    assert [item["id"] for item in second["items"]] == [orders[0].id]
+    assert second["next_cursor"] is None
+
+
+def test_get_order_detail(client, admin_headers, db_session):
+    """Order detail serializes payments and eSIM without lazy loads."""
+    plan = _create_plan(db_session, iso2="PY")
+    user = _create_user(db_session, email="detail@example.com")
+    order = _create_order(db_session, user, plan, amount_minor_units=1500)
+    _add_payment(db_session, order, intent_id="pi_detail")
+    _add_payment(db_session, order, intent_id="pi_detail_retry")
+    _link_esim(db_session, order, user, plan)
+
+    response = client.get(f"/admin/orders/{order.id}", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user"]["email"] == "detail@example.com"
+    assert data["payments"][0]["order_amount_minor_units"] == 1500
+    # Newest payment first
+    assert [p["intent_id"] for p in data["payments"]] == [
+        "pi_detail_retry",
+        "pi_detail",
+    ]
+    assert data["esim_profile"]["inventory_item_id"] is not None
+
+
 def test_list_payments_filters_by_provider(client, admin_headers, db_session):
     """Payments endpoint should filter by provider and status."""
     plan = _create_plan(db_session, iso2="BR", carrier_name="Carrier BR")
@@ -190,6 +259,15 @@ def test_list_payments_filters_by_provider(client, admin_headers, db_session):
     assert payment["order_id"] == order.id
 
 
+def test_list_payments_rejects_unknown_provider(client, admin_headers):
+    """Unknown providers are rejected like unknown statuses."""
+    response = client.get(
+        "/admin/payments", params={"provider": "paypal"}, headers=admin_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid payment provider: paypal"
+
+
 def test_list_esims_filters_by_status(client, admin_headers, db_session):
     """eSIM endpoint should filter by profile and inventory statuses."""
     plan = _create_plan(db_session, iso2="CL")
@@ -224,6 +302,15 @@ def test_list_esims_filters_by_status(client, admin_headers, db_session):
     assert esim["status"] == "active"
     assert esim["inventory_item_id"] is not None
 
+    response = client.get(
+        "/admin/esims", params={"user_q": "ESIM@"}, headers=admin_headers
+    )
+    assert response.json()["total"] == 2
+    response = client.get(
+        "/admin/esims", params={"user_q": "nobody"}, headers=admin_headers
+    )
+    assert response.json()["total"] == 0
+
 
 def test_list_inventory_supports_search(client, admin_headers, db_session):
     """Inventory listing should support text search and filtering by status."""
@@ -262,6 +349,111 @@ def test_list_inventory_supports_search(client, admin_headers, db_session):
     assert item["status"] == "available"
 
 
+def _walk_pages(client, headers, params) -> tuple[list[int], list]:
+    """Follow next_cursor from the first page; return ids and each page's total."""
+    ids, totals = [], []
+    cursor = None
+    while True:
+        page_params = {**params, "after": cursor} if cursor else params
+        data = client.get("/admin/inventory", params=page_params, headers=headers)
+        data = data.json()
+        ids += [item["id"] for item in data["items"]]
+        totals.append(data["total"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids, totals
+
+
+def test_list_inventory_cursor_with_null_sort_values(client, admin_headers, db_session):
+    """Cursor paging by a nullable column keeps the rows whose value is NULL."""
+    plan = _create_plan(db_session, iso2="GY")
+    items = [
+        EsimInventory(plan_id=plan.id if i % 2 else None, activation_code=f"N-{i}")
+        for i in range(6)
+    ]
+    db_session.add_all(items)
+    db_session.commit()
+
+    for sort_order in ("desc", "asc"):
+        params = {"sort_by": "plan_id", "sort_order": sort_order}
+        everything = client.get(
+            "/admin/inventory", params=params, headers=admin_headers
+        ).json()
+        expected = [item["id"] for item in everything["items"]]
+        assert len(expected) == 6
+
+        ids, totals = _walk_pages(client, admin_headers, {**params, "page_size": 2})
+        assert ids == expected
+        assert totals == [6, 6, 6]
+
+        ids, totals = _walk_pages(
+            client,
+            admin_headers,
+            {**params, "page_size": 2, "include_total": "false"},
+        )
+        assert ids == expected
+        assert totals == [None, None, None]
+
+
+def test_list_orders_status_sort_pages_by_offset(client, admin_headers, db_session):
+    """Enum sorts never hand out cursors and always report the total."""
+    plan = _create_plan(db_session)
+    user = _create_user(db_session)
+    for _ in range(3):
+        _create_order(db_session, user, plan)
+
+    params = {"sort_by": "status", "page_size": 2, "include_total": "false"}
+    data = client.get("/admin/orders", params=params, headers=admin_headers).json()
+    assert data["total"] == 3
+    assert data["next_cursor"] is None
+
+    cursor = client.get(
+        "/admin/orders", params={"page_size": 2}, headers=admin_headers
+    ).json()["next_cursor"]
+    response = client.get(
+        "/admin/orders",
+        params={"sort_by": "status", "after": cursor},
+        headers=admin_headers,
+    )
+    assert response.status_code == 400
+
+
+def test_import_inventory_csv_repeated_code(client, admin_headers, db_session):
+    """A code repeated in one import updates the item created earlier."""
+    plan = _create_plan(db_session, iso2="EC")
+    db_session.add(
+        EsimInventory(plan_id=plan.id, activation_code="EXISTING", iccid="OLD")
+    )
+    db_session.commit()
+
+    csv_body = (
+        "activation_code,plan_id,iccid,status\n"
+        f"EXISTING,{plan.id},NEW,available\n"
+        f"DUP,{plan.id},FIRST,available\n"
+        f"DUP,{plan.id},SECOND,reserved\n"
+    )
+    response = client.post(
+        "/admin/inventory/import",
+        files={"file": ("inventory.csv", csv_body, "text/csv")},
+        headers=admin_headers,
+    )
+    assert response.json() == {
+        "success": True,
+        "created": 1,
+        "updated": 2,
+        "errors": [],
+    }
+
+    items = {
+        item.activation_code: item for item in db_session.query(EsimInventory).all()
+    }
+    assert len(items) == 2
+    assert items["EXISTING"].iccid == "NEW"
+    assert items["DUP"].iccid == "SECOND"
+    assert items["DUP"].status == EsimInventoryStatus.RESERVED
+    assert items["DUP"].created_at is not None
+
+
 def test_inventory_stats_reports_low_stock(client, admin_headers, db_session):
     """Inventory stats should aggregate totals and produce low stock alerts."""
     plan = _create_plan(db_session, iso2="PE")
@@ -301,3 +493,44 @@ def test_inventory_stats_reports_low_stock(client, admin_headers, db_session):
     alert = stats["low_stock_alerts"][0]
     assert alert["available"] == 2
     assert alert["plan_id"] == plan.id
+
+
+def test_inventory_stats_refresh_after_import(client, admin_headers, db_session):
+    """Cached stats are dropped when an inventory import commits."""
+    plan = _create_plan(db_session, iso2="BO")
+
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["totals"]["available"] == 0
+
+    response = client.post(
+        "/admin/inventory/import",
+        files={
+            "file": (
+                "inventory.csv",
+                f"activation_code,plan_id\nNEW-1,{plan.id}\n",
+                "text/csv",
+            )
+        },
+        headers=admin_headers,
+    )
+    assert response.json()["success"] is True
+
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["totals"]["available"] == 1
+    assert stats["low_stock_alerts"][0]["plan_id"] == plan.id
+
+
+def test_inventory_stats_refresh_after_plan_rename(client, admin_headers, db_session):
+    """Cached low-stock alerts pick up a renamed plan."""
+    plan = _create_plan(db_session, iso2="PA")
+    db_session.add(EsimInventory(plan_id=plan.id, activation_code="RENAME-1"))
+    db_session.commit()
+
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["low_stock_alerts"][0]["plan_name"] == "Plan PA"
+
+    client.put(
+        f"/admin/plans/{plan.id}", json={"name": "Panama 5GB"}, headers=admin_headers
+    )
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["low_stock_alerts"][0]["plan_name"] == "Panama 5GB"
@@ -347,12 +347,14 @@ def _seed_inventory(plan_id: int) -> int:
         return cast(int, inventory.id)
 
 
-def test_esim_activation_consumes_inventory_first(setup_database):
+def test_esim_activation_consumes_inventory_first(setup_database, admin_headers):
     email = "esim_inventory@test.com"
     plan_id = seed_plan()
     inventory_id = _seed_inventory(plan_id)
     token = get_auth_token(email)
     order_id = create_paid_order(token, plan_id)
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["totals"]["available"] == 1
 
     response = client.post(
         "/api/esims/activate",
@@ -372,6 +374,11 @@ def test_esim_activation_consumes_inventory_first(setup_database):
         assert inventory.assigned_at is not None
         assert inventory.activation_code == data["activation_code"]
 
+    # The cached admin stats were dropped by the activation
+    stats = client.get("/admin/inventory/stats", headers=admin_headers).json()
+    assert stats["totals"]["available"] == 0
+    assert stats["totals"]["assigned"] == 1
+
 
 def test_esim_activation_creates_inventory_when_provider_used(setup_database):
     email = "esim_provider_inventory@test.com"